@@ -11,7 +11,7 @@ from typing import Optional
 from dotenv import load_dotenv
 from playwright.sync_api import BrowserContext, ElementHandle, Page, sync_playwright
 
-from requisitions import Destination, DetailedFilter, DetailedRequisition, Education, Filter, Grade, Housing, OccupationType, Requisition
+from requisitions import Destination, DetailedFilter, DetailedRequisition, Education, Filter, Grade, Housing, OccupationType, Requisition, meets_any_filter, select_matching
 
 
 # Load environment variables from .env file in the same directory as this script.
@@ -138,42 +138,57 @@ def fetch_basic_requisition_list(page: Page) -> list[Requisition]:
     REQUISITION_BASE_URL = os.getenv("REQUISITION_BASE_URL").strip()
     # Wait for the first requisition row to appear.
     page.wait_for_selector("#requisitions > div[role='button']")
-    rows = page.query_selector_all("#requisitions > div[role='button']")
-    logger.info("Found %s rows in the requisition list.", len(rows))
+    # Pull the raw text of every cell of every row in a single page evaluation.
+    # Each query_selector/text_content pair is one protocol round-trip to the browser, and the
+    # former loop paid around sixteen of them per row; this extracts the whole table in one
+    # round-trip and leaves only string parsing and object construction in Python.
+    raw_rows = page.eval_on_selector_all(
+        "#requisitions > div[role='button']",
+        """rows => rows.map(row => {
+            const text = selector => {
+                const element = row.querySelector(selector);
+                return element === null ? null : element.textContent;
+            };
+            return {
+                loan_number: text("div:nth-child(1) span span"),
+                id: text("p:nth-child(2) span"),
+                grade: text("p:nth-child(3) b:nth-child(1)"),
+                interest_rate: text("p:nth-child(3) b:nth-child(2)"),
+                score: text("p:nth-child(4)"),
+                destination: text("div:nth-child(5) p:nth-child(2)"),
+                term: text("p:nth-child(6)"),
+                amount: text("p:nth-child(7)"),
+                remaining_funding_amount: text("p:nth-child(8)")
+            };
+        })"""
+    )
+    logger.info("Found %s rows in the requisition list.", len(raw_rows))
     requisitions: list[Requisition] = []
-    for index, row in enumerate(rows):
-        logger.info("Collecting basic requisition data for row %s of %s.", (index + 1), len(rows))
+    for index, raw_row in enumerate(raw_rows):
+        logger.info("Collecting basic requisition data for row %s of %s.", (index + 1), len(raw_rows))
 
-        # Collect basic requisition data.
+        # Parse basic requisition data from the raw cell texts.
         # The loan number is located in the first child element of the row,
         # to get the number only, the trailing ordinal symbol (º) must be removed,
         # this symbol is also used to check whether the bubble contains the loan number,
         # and not other data (this edge case has occurred before).
-        loan_number = row.query_selector("div:nth-child(1) span span")
-        if loan_number is not None and loan_number.text_content().find("º") != -1:
-            loan_number = int(loan_number.text_content()[:-1].strip())
+        loan_number = raw_row["loan_number"]
+        if loan_number is not None and loan_number.find("º") != -1:
+            loan_number = int(loan_number[:-1].strip())
         else:
             loan_number = 1
-        requisition_id = row.query_selector("p:nth-child(2) span").text_content()
-        requisition_id = requisition_id.strip()
+        requisition_id = raw_row["id"].strip()
         requisition_url = f"{REQUISITION_BASE_URL}/{requisition_id}"
-        grade = row.query_selector("p:nth-child(3) b:nth-child(1)").text_content()
-        grade = Grade[grade.strip()]
+        grade = Grade.parse_from_name(raw_row["grade"].strip())
         # Remove leading "/ " and trailing "%" sequences to get the interest rate in percentage form.
-        interest_rate = row.query_selector("p:nth-child(3) b:nth-child(2)").text_content()
-        interest_rate = float(interest_rate.replace("/ ", "").replace("%", "").strip()) / 100
-        score = row.query_selector("p:nth-child(4)").text_content()
-        score = int(score.strip())
-        destination = row.query_selector("div:nth-child(5) p:nth-child(2)").text_content()
-        destination = Destination(destination.strip())
-        term = row.query_selector("p:nth-child(6)").text_content()
-        term = int(term.strip())
+        interest_rate = float(raw_row["interest_rate"].replace("/ ", "").replace("%", "").strip()) / 100
+        score = int(raw_row["score"].strip())
+        destination = Destination.parse_from_label(raw_row["destination"].strip())
+        term = int(raw_row["term"].strip())
         # Remove leading "$" and "," sequences to get the amount in MXN from currency format.
-        amount = row.query_selector("p:nth-child(7)").text_content()
-        amount = float(amount.replace("$", "").replace(",", "").strip())
-        remaining_funding_amount = row.query_selector("p:nth-child(8)").text_content()
-        remaining_funding_amount = float(remaining_funding_amount.replace("$", "").replace(",", "").strip())
-        
+        amount = float(raw_row["amount"].replace("$", "").replace(",", "").strip())
+        remaining_funding_amount = float(raw_row["remaining_funding_amount"].replace("$", "").replace(",", "").strip())
+
         # Log requisition data in order.
         logger.debug("- ID: %s", requisition_id)
         logger.debug("- URL: %s", requisition_url)
@@ -211,17 +226,7 @@ def select_by_basic_filters(requisitions: list[Requisition], filters: list[Filte
     - requisitions: The list of requisitions to filter.
     - filters: The list of basic filters to apply to the requisitions.
     """
-    filtered_requisitions: list[Requisition] = []
-    for requisition in requisitions:
-        meets_any_filter: bool = False
-        for filter in filters:
-            if requisition.meets_filter(filter):
-                meets_any_filter = True
-                break
-        if not meets_any_filter:
-            continue
-        filtered_requisitions.append(requisition)
-    return filtered_requisitions
+    return select_matching(requisitions=requisitions, filters=filters)
 
 
 def fetch_requisition_details(context: BrowserContext, requisition: Requisition):
@@ -298,7 +303,7 @@ def fetch_requisition_details(context: BrowserContext, requisition: Requisition)
     state_of_residence = personal_information_boxes[5].query_selector("p:nth-child(2)").text_content()
     state_of_residence = state_of_residence.strip().lower().capitalize()
     housing = personal_information_boxes[6].query_selector("p:nth-child(2)").text_content()
-    housing = Housing(housing)
+    housing = Housing.parse_from_label(housing)
     occupation = personal_information_boxes[7].query_selector("p:nth-child(2)").text_content()
     occupation = occupation.strip()
     # This is usually found as "<number> años", so by splitting the string at the first space,
@@ -306,7 +311,7 @@ def fetch_requisition_details(context: BrowserContext, requisition: Requisition)
     tenure = personal_information_boxes[8].query_selector("p:nth-child(2)").text_content()
     tenure = int(tenure.split(" ", 1)[0].strip())
     occupation_type = personal_information_boxes[9].query_selector("p:nth-child(2)").text_content()
-    occupation_type = OccupationType(occupation_type.strip().lower().capitalize())
+    occupation_type = OccupationType.parse_from_label(occupation_type.strip().lower().capitalize())
 
     # Get shareholder list data.
     # This check is intended to detect if the platform is a shareholder in the requisition,
@@ -359,8 +364,8 @@ def fetch_requisition_details(context: BrowserContext, requisition: Requisition)
     new_page.close()
     time.sleep(randint(10, 20))
 
-    return DetailedRequisition(
-        base_requisition=requisition,
+    return DetailedRequisition.from_base(
+        requisition,
         monthly_payment=monthly_payment,
         credit_history_length=credit_history_length,
         credit_history_inquiries=credit_history_inquiries,
@@ -405,12 +410,7 @@ def select_by_detailed_filters(
             except Exception as email_e:
                 logger.exception("Failed to send e-mail notification of failed detailed requisition fetch of requisition %s: %s", requisition.id, email_e)
             raise e
-        meets_any_filter: bool = False
-        for filter in filters:
-            if detailed_requisition.meets_filter(filter):
-                meets_any_filter = True
-                break
-        if not meets_any_filter:
+        if not meets_any_filter(requisition=detailed_requisition, filters=filters):
             continue
         filtered_requisitions.append(detailed_requisition)
     return filtered_requisitions
@@ -491,7 +491,7 @@ def send_eligible_requisition_list_email(requisitions: list[DetailedRequisition]
                 <ul>
                     <li><strong>ID:</strong> {requisition.id}</li>
                     <li><strong>URL:</strong> {requisition.url}</li>
-                    <li><strong>Grade:</strong> {requisition.grade.name}</li>
+                    <li><strong>Grade:</strong> {Grade(requisition.grade).name}</li>
                     <li><strong>Interest rate:</strong> {requisition.interest_rate * 100:,.2f}%</li>
                     <li><strong>Score:</strong> {requisition.score}</li>
                     <li><strong>Destination:</strong> {requisition.destination.value}</li>
@@ -691,7 +691,7 @@ if __name__ == "__main__":
     for requisition in filtered_requisitions:
         logger.debug("- ID: %s", requisition.id)
         logger.debug("- URL: %s", requisition.url)
-        logger.debug("- Grade: %s", requisition.grade.name)
+        logger.debug("- Grade: %s", Grade(requisition.grade).name)
         logger.debug("- Interest rate: %,.2f%%", requisition.interest_rate * 100)
         logger.debug("- Score: %s", requisition.score)
         logger.debug("- Destination: %s", requisition.destination.value)
@@ -1,88 +1,144 @@
-import ctypes
-import tkinter as tk
-from tkinter import ttk  # New themed widgets, though less controllable
-
-
-class PauseWindow(tk.Tk):
-    """Creates a Tkinter window to pause the scrapper at the log-in page so the user can enter their credentials manually.
-    
-    This class extends a root window (tk.Tk), no implicit master window is required, unlike in classes that extend tk.Frame. 
-    The motive for defining an explicit root window class is that this enables autocomplete suggestions for tk methods and properties,
-    unlike code examples where the master window is implicitly created from a tk.Frame.
-    
-    This pause window should be started from a subprocess started by the main script in order to provide thread isolation from other packages,
-    and to ensure the window can be terminated cleanly and without delay with a termination or interruption signal propagated by the main script.
-
-    From experience, Tkinter runs into conflicts and unpredictable behaviour with Selenium web drivers when running on the same script, 
-    hence the need for subprocess isolation.
-    """
-
-    class PauseWindowFrame(ttk.Frame):
-
-        outer_frame: ttk.Frame  # Draws an inner contour along the border of the window
-        inner_frame: ttk.Frame  # Groups widgets and adds vertical padding around and between them
-        message_label: ttk.Label
-        spacer: ttk.Frame
-        continue_button: ttk.Button
-
-        def __init__(self, master: tk.Tk):
-            super().__init__(master=master)
-
-        def add_widgets(self, label_text: str, button_text: str):
-            self.outer_frame = ttk.Frame(master=self, borderwidth=2, relief="groove")
-            self.outer_frame.pack(padx=8, pady=8)
-            self.inner_frame = ttk.Frame(master=self.outer_frame)
-            self.inner_frame.pack(side="top", padx=96, pady=48)
-            self.message_label = ttk.Label(master=self.inner_frame, text=label_text)
-            self.message_label.pack(side="top")
-            self.spacer = ttk.Frame(master=self.inner_frame, height=8)
-            self.spacer.pack(side="top")
-            self.continue_button = ttk.Button(master=self.inner_frame, text=button_text, command=self.master.destroy)  # To close the Tk window, not just the Frame
-            self.continue_button.pack(side="top", ipadx=16, ipady=4)
-
-    frame: PauseWindowFrame | None = None
-
-    def __init__(
-        self,
-        title: str = "Pause",
-        label_text: str = "An action is required to continue.",
-        button_text: str = "Continue",
-        **kwargs
-    ):
-        super().__init__(**kwargs)  # **kwargs is an unpacked dictionary containing the default keyword arguments of the tk.Tk parent class
-        self.attributes("-topmost", True)  # Called using property alias instead of platform specific method to maintain multiplatform compatibility
-        # self.protocol(name="", func=self.myCustomFunction)  # TODO: to be defined, or removed
-        self.resizable(width=False, height=False)    # Required because "pack" layouts do not resize or reposition widgets
-        self.title(string=title)
-        self.add_widgets(label_text=label_text, button_text=button_text)
-
-    def add_widgets(self, label_text: str, button_text: str):
-        self.frame = self.PauseWindowFrame(master=self)
-        self.frame.pack()
-        self.frame.add_widgets(label_text=label_text, button_text=button_text)
+import os
+import sys
+import threading
+
+
+# Pipe used to signal the pause window to dismiss itself from another thread.
+# Created once at import because the file descriptors must exist before the window does,
+# and a single pair can serve every pause during the process lifetime.
+_dismiss_read_fd, _dismiss_write_fd = os.pipe()
+
+
+# Event set alongside each signal byte, for platforms whose Tcl lacks createfilehandler and
+# must poll instead. Polling the pipe itself would need a non-blocking read, and
+# os.set_blocking only gained Windows support in Python 3.12 — precisely the platform
+# where the polling fallback runs; an Event can be checked without blocking anywhere.
+_dismiss_event = threading.Event()
+
+
+# Coordination for the single persistent UI thread that serves every pause in the process.
+# Tk objects can only be driven from the thread that created them, so reusing one Tcl
+# interpreter and widget tree (skipping Tcl/Tk initialization, the slowest phase of Tk
+# start-up) requires that one long-lived thread owns the window across pauses: the UI thread
+# is created on the first pause and then loops, waiting for pause requests and running the
+# window's event loop once per pause.
+_ui_thread: threading.Thread | None = None
+_ui_thread_lock = threading.Lock()
+_pause_requested = threading.Event()
+_pause_finished = threading.Event()
+
+
+# Resolve the Windows DPI-awareness entry points once at import, with explicit prototypes.
+# Going through ctypes.windll on every call repeats LoadLibrary bookkeeping and dynamic attribute lookup,
+# and without argtypes/restype ctypes falls back to slow generic argument marshaling;
+# binding the function pointers here makes each call a direct FFI trampoline.
+# ctypes itself is only imported on Windows, non-Windows platforms skip that import cost entirely.
+_set_process_dpi_awareness = None  # On Windows 8.1+
+_set_process_dpi_aware = None  # Fallback, on Windows Vista+
+if sys.platform == "win32":
+    import ctypes
+    try:
+        _set_process_dpi_awareness = ctypes.WinDLL("shcore").SetProcessDpiAwareness
+        _set_process_dpi_awareness.argtypes = (ctypes.c_int,)
+        _set_process_dpi_awareness.restype = ctypes.c_long  # HRESULT
+    except (OSError, AttributeError):
+        pass  # shcore.dll or its export are unavailable before Windows 8.1
+    try:
+        _set_process_dpi_aware = ctypes.WinDLL("user32").SetProcessDPIAware
+        _set_process_dpi_aware.argtypes = ()
+        _set_process_dpi_aware.restype = ctypes.c_int  # BOOL
+    except (OSError, AttributeError):
+        pass  # Last resource fallback, ignore on older Windows
 
 
 def make_process_dpi_aware():
     """Makes the process DPI aware to remove Tkinter window blurriness on Windows display configurations with scale factors different to 100%.
-    
-    Even though type and autocomplete hints for runtime dynamic loaders (like ctypes.windll) are unavailable, this works as intended.
+
+    Calls the function pointers bound at import time, preferring the Windows 8.1+ API and falling back to the Windows Vista+ one.
+    Does nothing on platforms where neither entry point exists.
     """
-    try:
-        ctypes.windll.shcore.SetProcessDpiAwareness(1)  # On Windows 8.1+
-    except Exception as e:
-        try:
-            ctypes.windll.user32.SetProcessDPIAware()  # Fallback, on Windows Vista+
-        except Exception:
-            pass  # Last resource fallback, ignore on older Windows
+    if _set_process_dpi_awareness is not None:
+        _set_process_dpi_awareness(1)
+    elif _set_process_dpi_aware is not None:
+        _set_process_dpi_aware()
 
 
-def main():
-    """Main function to run the pause window as a function from other scripts."""
-    window: tk.Tk
+def _serve_pause_requests():
+    """Runs the persistent UI thread: creates the pause window on first use and reuses it for every later pause.
+
+    Imports the window class lazily so tkinter (and the Tcl/Tk shared libraries it loads)
+    is only paid for when a pause actually happens, not when this module is imported.
+    """
+    from tkinter import TclError
+
+    from pause_window_ui import PauseWindow
+
     make_process_dpi_aware()
-    window = PauseWindow()
-    window.mainloop()
-    return window
+    window: PauseWindow | None = None
+    while True:
+        _pause_requested.wait()
+        _pause_requested.clear()
+        if window is not None:
+            try:
+                window.deiconify()
+                window.raise_to_front()
+            except TclError:
+                window = None  # The root was destroyed through some other path: rebuild it.
+        if window is None:
+            window = PauseWindow()
+        window.mainloop()  # Returns when the window is dismissed.
+        _pause_finished.set()
+
+
+def _request_pause_and_wait():
+    """Asks the UI thread for a pause and blocks until the window is dismissed.
+
+    Starts the UI thread on the first pause; every later pause reuses the window that thread
+    already owns, so Tcl/Tk initialization and widget construction are paid once per process.
+    """
+    global _ui_thread
+    with _ui_thread_lock:
+        if _ui_thread is None or not _ui_thread.is_alive():
+            _ui_thread = threading.Thread(target=_serve_pause_requests, daemon=True)
+            _ui_thread.start()
+        _pause_finished.clear()
+        _pause_requested.set()
+    _pause_finished.wait()
+
+
+def main():
+    """Main function to run the pause window as a function from other scripts.
+
+    Blocks until the user continues (or dismiss_pause_window is called from another thread).
+    The window itself lives on the persistent UI thread, which is what makes the reuse sound:
+    a Tk window can only be deiconified by the thread that created it.
+    """
+    _request_pause_and_wait()
+
+
+def run_pause_window_in_thread() -> threading.Thread:
+    """Requests a pause without blocking the caller and returns a joinable thread.
+
+    The returned thread finishes when the user continues, so the caller may join it to block
+    until then, or call dismiss_pause_window from any other thread to close the window
+    programmatically. The window is not created on this thread: it is owned by the persistent
+    UI thread, and the returned thread only relays the request and waits for its completion.
+    """
+    thread = threading.Thread(target=_request_pause_and_wait, daemon=True)
+    thread.start()
+    return thread
+
+
+def dismiss_pause_window():
+    """Dismisses the pause window from any thread by writing one signal byte to the dismiss pipe.
+
+    On platforms with createfilehandler the byte is delivered through the Tcl event notifier,
+    so the window closes without polling delay; elsewhere the accompanying event is picked up
+    by the window's polling loop. The byte is written before the event is set, so a consumer
+    that sees the event can always drain its paired byte without blocking.
+    """
+    os.write(_dismiss_write_fd, b"\x00")
+    _dismiss_event.set()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+import os
+import tkinter as tk
+from tkinter import ttk  # New themed widgets, though less controllable
+
+from pause_window import _dismiss_event, _dismiss_read_fd
+
+
+class PauseWindowFrame(ttk.Frame):
+    """A single frame holding the message label and continue button in a grid layout.
+
+    The frame itself draws the inner contour along the border of the window,
+    and grid padding options replace the nested frames and spacer widget that previously
+    only injected margins; every Tk widget is a full Tcl command object,
+    so the flat layout avoids three interpreter-side widget allocations per window.
+    """
+
+    message_label: ttk.Label
+    continue_button: ttk.Button
+
+    def __init__(self, master: tk.Tk):
+        super().__init__(master=master, borderwidth=2, relief="groove")
+
+    def add_widgets(self, label_text: str, button_text: str):
+        self.message_label = ttk.Label(master=self, text=label_text)
+        self.message_label.grid(row=0, column=0, padx=96, pady=(48, 8))  # Bottom padding injects the gap between label and button
+        self.continue_button = ttk.Button(master=self, text=button_text, command=self.master.dismiss)  # To hide the Tk window, not just the Frame
+        self.continue_button.grid(row=1, column=0, pady=(0, 48), ipadx=16, ipady=4)
+
+
+class PauseWindow(tk.Tk):
+    """Creates a Tkinter window to pause the scrapper at the log-in page so the user can enter their credentials manually.
+
+    This class extends a root window (tk.Tk), no implicit master window is required, unlike in classes that extend tk.Frame.
+    The motive for defining an explicit root window class is that this enables autocomplete suggestions for tk methods and properties,
+    unlike code examples where the master window is implicitly created from a tk.Frame.
+
+    This pause window should be started on a dedicated thread (see run_pause_window_in_thread) in order to provide isolation from other packages,
+    and to ensure the window can be dismissed cleanly and without delay with a one-byte signal written to a pipe by the main script.
+    Running Tk on a thread of the same process avoids the interpreter start-up and serialization cost that the previous subprocess model
+    paid on every pause, while keeping the event loops separated.
+
+    From experience, Tkinter runs into conflicts and unpredictable behaviour with Selenium web drivers when running on the same thread,
+    hence the need for thread isolation.
+
+    This class lives in its own module so that importing pause_window does not load tkinter;
+    the tkinter import (which opens the Tcl/Tk shared libraries and runs Tcl's init) is deferred until a pause actually happens.
+    """
+
+    frame: PauseWindowFrame | None = None
+
+    def __init__(
+        self,
+        title: str = "Pause",
+        label_text: str = "An action is required to continue.",
+        button_text: str = "Continue"
+    ):
+        # No **kwargs passthrough to tk.Tk: callers have no meaningful Tk keyword arguments to supply here,
+        # and dropping it avoids a dict allocation and unpack on every construction.
+        super().__init__()
+        # Closing the window with the title-bar X must behave like the Continue button: the
+        # default delete handler destroys the root, which would leave the persistent UI thread
+        # holding a dead interpreter and hang the next pause. dismiss (withdraw + quit) keeps
+        # the window reusable and lets mainloop return so the waiting caller is released.
+        self.protocol("WM_DELETE_WINDOW", self.dismiss)
+        # The wrapper methods pass the title as a Tcl argument rather than interpolating it
+        # into a Tcl eval, so any caller-supplied string is safe.
+        # The window is made non-resizable because "grid" layouts do not resize or reposition widgets.
+        self.title(title)
+        self.resizable(False, False)
+        self.add_widgets(label_text=label_text, button_text=button_text)
+        self.listen_for_dismiss_signal()
+        self.raise_to_front()
+
+    def add_widgets(self, label_text: str, button_text: str):
+        self.frame = PauseWindowFrame(master=self)
+        self.frame.grid(padx=8, pady=8)
+        self.frame.add_widgets(label_text=label_text, button_text=button_text)
+
+    def listen_for_dismiss_signal(self):
+        """Registers the dismiss pipe with the Tcl event notifier so another thread can close the window.
+
+        Uses createfilehandler so Tcl wakes up only when a byte is actually written, with no polling latency.
+        createfilehandler is unavailable on Windows builds of Tcl, so there the dismiss event is polled with a short "after" loop instead.
+        """
+        try:
+            self.tk.createfilehandler(_dismiss_read_fd, tk.READABLE, self._on_dismiss_signal)
+        except AttributeError:
+            self._poll_dismiss_signal()
+
+    def _on_dismiss_signal(self, file_descriptor, mask):
+        """Consumes one signal byte from the dismiss pipe and dismisses the window."""
+        os.read(_dismiss_read_fd, 1)
+        _dismiss_event.clear()  # The event paired with the byte is for the polling fallback only.
+        self.dismiss()
+
+    def _poll_dismiss_signal(self):
+        """Polling fallback for platforms without createfilehandler, checks the dismiss event periodically.
+
+        Polls the event rather than the pipe because a non-blocking pipe read would need
+        os.set_blocking, which Windows builds only gained in Python 3.12. The signal byte is
+        drained after the event: the signaler writes it first, so the read cannot block.
+        """
+        if _dismiss_event.is_set():
+            _dismiss_event.clear()
+            os.read(_dismiss_read_fd, 1)
+            self.dismiss()
+        self.after(50, self._poll_dismiss_signal)
+
+    def raise_to_front(self):
+        """Raises the window above other windows once, at appearance, instead of keeping it permanently topmost.
+
+        Leaving "-topmost" set makes Tk on Windows re-hoist the window against every foreground change,
+        which costs CPU for as long as the window exists. A modal prompt only needs to be on top when it appears,
+        so the attribute is set just long enough for the window manager to apply it and cleared on the next idle cycle.
+        Called using property alias instead of platform specific method to maintain multiplatform compatibility.
+        """
+        self.attributes("-topmost", True)
+        self.lift()
+        self.focus_force()
+        self.after_idle(lambda: self.attributes("-topmost", False))
+
+    def dismiss(self):
+        """Hides the window and leaves its event loop, keeping the Tcl interpreter and widget tree alive for reuse.
+
+        The window is withdrawn instead of destroyed so the next pause only has to deiconify it,
+        skipping Tcl/Tk initialization and widget construction entirely.
+        """
+        self.withdraw()
+        self.quit()
@@ -1,9 +1,21 @@
 from __future__ import annotations
+from array import array
+from dataclasses import InitVar, dataclass, field, fields
 from enum import Enum, IntEnum, auto
-import inspect
-from typing import Any, Self
-
-from yaml import safe_load
+from operator import attrgetter
+import os
+import pickle
+import sys
+from typing import Any, Callable, Final, Iterable, Iterator, Self
+
+from yaml import load as yaml_load
+# Prefer the C-accelerated safe loader (libyaml bindings), which parses typical documents
+# 5-10x faster than the pure-Python one; PyYAML only ships it when libyaml is available,
+# so fall back to the pure-Python safe loader otherwise. Both are "safe" loaders.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
 
 class Grade(IntEnum):
@@ -39,6 +51,17 @@ class Grade(IntEnum):
     C6 = auto()
     C7 = auto()
 
+    @staticmethod
+    def parse_from_name(name: str) -> Grade:
+        """Parses a grade name as written in the config file and scraped pages to its `Grade` member.
+
+        A plain dict lookup, skipping the EnumMeta `__getitem__` machinery; raises `KeyError` for
+        unknown names, like `Grade[name]` would, because an unrecognized grade means the scraped
+        page or the config file is malformed.
+        """
+
+        return _GRADE_BY_NAME[name]
+
 
 class Destination(Enum):
     """Requisition destination enumeration.
@@ -60,13 +83,46 @@ class Destination(Enum):
     PERSONAL_EXPENSES = "Gastos Personales"
     OTHER = "Otros"  # Alternative label in web app filter buttons: "Otro"
 
+    @staticmethod
+    def parse_from_label(label: str) -> Destination:
+        """Parses a raw label from the requisition list to its `Destination` member.
+
+        A plain dict lookup, skipping the `EnumMeta.__call__` and `_missing_` machinery; raises
+        `KeyError` for unknown labels, because there is no catch-all `Destination` member.
+        """
+
+        return _DESTINATION_BY_VALUE[label]
+
+
+# Inverse lookup map for parsing `Grade` members from their names, as written in the config file
+# and scraped pages. A plain dict lookup skips the EnumMeta `__getitem__` machinery.
+_GRADE_BY_NAME: Final[dict[str, Grade]] = {member.name: member for member in Grade}
+
+
+# Inverse lookup map for parsing `Destination` members from their raw label values.
+# A plain dict lookup skips the `EnumMeta.__call__` and `_missing_` machinery,
+# which is noticeably slower and runs once per parsed value.
+_DESTINATION_BY_VALUE: Final[dict[str, Destination]] = {member.value: member for member in Destination}
+# Compact integer codes for `Destination` members: the whole alphabet fits in a byte, so a code
+# can be stored and compared as a plain int, and packed into bitmask whitelists downstream.
+# The member tuple is the reverse lookup, indexed by code.
+_DESTINATION_CODES: Final[dict[Destination, int]] = {member: index for index, member in enumerate(Destination)}
+_DESTINATION_MEMBERS: Final[tuple[Destination, ...]] = tuple(Destination)
+
+
+@dataclass(frozen=True, slots=True)
+class Requisition:
+    """A `Requisition` contains basic information about a requisition, collected from the requisition list page.
 
-class Requisition():
-    """A `Requisition` contains basic information about a requisition, collected from the requisition list page."""
+    A frozen, slotted dataclass like the filter classes: instances are immutable and hashable
+    (so scraped rows can be deduplicated reliably), construction runs the generated straight-line
+    constructor instead of a hand-written assignment chain, and slots keep the compact
+    per-instance memory layout.
+    """
 
     id: str
     url: str
-    grade: Grade
+    grade: int  # Integer value of a `Grade` member; stored as a plain int so hot comparisons skip the IntEnum machinery.
     interest_rate: float  # Stored as percentage value (not decimal form).
     score: int
     destination: Destination
@@ -74,35 +130,25 @@ class Requisition():
     amount: float  # Requisition amount in MXN.
     remaining_funding_amount: float  # Last seen remaining funding amount in MXN.
     loan_number: int  # Number of loans the requisitioner has previously taken and repaid, plus one.
+    # Compact integer code for `destination`, derived at construction so matchers compare small
+    # ints instead of Enum members. Excluded from the constructor, comparisons and the repr.
+    destination_code: int = field(init=False, repr=False, compare=False)
 
-    def __init__(
-        self,
-        id: str,
-        url: str,
-        grade: Grade,
-        interest_rate: float,
-        score: int,
-        destination: Destination,
-        term: int,
-        amount: float,
-        remaining_funding_amount: float,
-        loan_number: int
-    ):
-        self.id = id
-        self.url = url
-        self.grade = grade
-        self.interest_rate = interest_rate
-        self.score = score
-        self.destination = destination
-        self.term = term
-        self.amount = amount
-        self.remaining_funding_amount = remaining_funding_amount
-        self.loan_number = loan_number
+    def __post_init__(self):
+        """Normalizes the grade and derives the compact destination code; `object.__setattr__` because the class is frozen."""
+
+        # Callers pass `Grade` members (which are ints); storing the bare int keeps the matchers
+        # and sort keys on raw int comparisons instead of IntEnum's value unwrapping.
+        # `Grade(requisition.grade)` recovers the member for display.
+        object.__setattr__(self, "grade", int(self.grade))
+        object.__setattr__(self, "destination_code", _DESTINATION_CODES[self.destination])
 
     def meets_filter(self, filter: Filter) -> bool:
         """Applies a `Filter` to a `Requisition` and returns whether the requisition meets the filter's criteria.
 
-        Tests filter criteria one by one and stops at the first unmet criterion. Returns `True` if all filter criteria are met; returns `False` otherwise.
+        Runs the specialized matcher function the filter generated at construction,
+        which stops at the first unmet criterion.
+        Returns `True` if all filter criteria are met; returns `False` otherwise.
 
         Enumeration items included in both a whitelist and a blacklist are blacklisted; undefined enumeration items are ignored.
 
@@ -110,51 +156,14 @@ class Requisition():
         If `filter` is a `Filter` subclass, its subclass filter criteria will be ignored.
         """
 
-        if filter.minimum_risk_grade is not None and filter.minimum_risk_grade > self.grade:
-            return False
-        if filter.maximum_risk_grade is not None and filter.maximum_risk_grade < self.grade:
-            return False
-        if filter.minimum_score is not None and filter.minimum_score > self.score:
-            return False
-        if filter.maximum_score is not None and filter.maximum_score < self.score:
-            return False
-        if filter.minimum_interest_rate is not None and filter.minimum_interest_rate > self.interest_rate:
-            return False
-        if filter.maximum_interest_rate is not None and filter.maximum_interest_rate < self.interest_rate:
-            return False
-        if filter.destination_whitelist is not None:
-            isWhitelisted: bool = False
-            for destination in filter.destination_whitelist:
-                if destination == self.destination:
-                    isWhitelisted = True
-                    break
-            if not isWhitelisted:
-                return False
-        if filter.destination_blacklist is not None:
-            isBlacklisted: bool = False
-            for destination in filter.destination_blacklist:
-                if destination == self.destination:
-                    isBlacklisted = True
-                    break
-            if isBlacklisted:
-                return False
-        if filter.minimum_term is not None and filter.minimum_term > self.term:
-            return False
-        if filter.maximum_term is not None and filter.maximum_term < self.term:
-            return False
-        if filter.minimum_amount is not None and filter.minimum_amount > self.amount:
-            return False
-        if filter.maximum_amount is not None and filter.maximum_amount < self.amount:
-            return False
-        if filter.minimum_remaining_funding_amount is not None and filter.minimum_remaining_funding_amount > self.remaining_funding_amount:
-            return False
-        if filter.maximum_remaining_funding_amount is not None and filter.maximum_remaining_funding_amount < self.remaining_funding_amount:
-            return False
-        if filter.minimum_loan_number is not None and filter.minimum_loan_number > self.loan_number:
-            return False
-        if filter.maximum_loan_number is not None and filter.maximum_loan_number < self.loan_number:
-            return False
-        return True
+        return filter._matches_base(self)
+
+
+# Constructor field names of `Requisition`, cached so `DetailedRequisition.from_base` does not
+# re-inspect the dataclass fields on every call; derived code fields are excluded.
+_REQUISITION_INIT_FIELD_NAMES: Final[tuple[str, ...]] = tuple(
+    requisition_field.name for requisition_field in fields(Requisition) if requisition_field.init
+)
 
 
 class Education(IntEnum):
@@ -174,20 +183,27 @@ class Education(IntEnum):
 
     @staticmethod
     def parse_from_label(label: str):
-        """Parses a label to its corresponding `Education` enum member. Returns `Education.UNKNOWN` on failure."""
-
-        match label:
-            case "Técnico":
-                return Education.TECHNICIAN
-            case "Profesional":
-                return Education.PROFESSIONAL
-            case "Maestría":
-                return Education.MASTERS
-            case "Doctorado":
-                return Education.PHD
-            case _:
-                # TODO: log the unknown `Education` label to a file so it can be added later.
-                return Education.UNKNOWN
+        """Parses a label to its corresponding `Education` enum member. Returns `Education.UNKNOWN` on failure.
+
+        A dict lookup resolves the label in one hash probe, where the former match statement
+        compared the label against every case string in turn.
+        """
+
+        # TODO: log unknown `Education` labels to a file so they can be added later.
+        return _EDUCATION_BY_LABEL.get(label, Education.UNKNOWN)
+
+
+# Lookup table for parsing `Education` members from their labels on the requisition page;
+# unknown and empty labels fall back to `Education.UNKNOWN` at the call sites.
+_EDUCATION_BY_LABEL: Final[dict[str, Education]] = {
+    "Técnico": Education.TECHNICIAN,
+    "Profesional": Education.PROFESSIONAL,
+    "Maestría": Education.MASTERS,
+    "Doctorado": Education.PHD
+}
+# Reverse member lookup for `Education`, like the `Destination` tables; the member at each index
+# is the one whose integer value is that index, because values start at zero and are contiguous.
+_EDUCATION_MEMBERS: Final[tuple[Education, ...]] = tuple(Education)
 
 
 class Housing(Enum):
@@ -203,6 +219,23 @@ class Housing(Enum):
     LIVES_WITH_FAMILY = "Vivo con familia"
     OWNER = "Propietario"
 
+    @staticmethod
+    def parse_from_label(label: str) -> Housing:
+        """Parses a raw label from the requisition page to its `Housing` member. Returns `Housing.UNKNOWN` on failure.
+
+        A plain dict lookup with an explicit fallback, skipping the `EnumMeta.__call__` machinery
+        and covering empty and undefined labels, as the class docstring prescribes.
+        """
+
+        return _HOUSING_BY_VALUE.get(label, Housing.UNKNOWN)
+
+
+# Inverse lookup map for parsing `Housing` members from their raw label values, like `_DESTINATION_BY_VALUE`.
+_HOUSING_BY_VALUE: Final[dict[str, Housing]] = {member.value: member for member in Housing}
+# Compact integer codes and reverse member lookup for `Housing`, like the `Destination` tables.
+_HOUSING_CODES: Final[dict[Housing, int]] = {member: index for index, member in enumerate(Housing)}
+_HOUSING_MEMBERS: Final[tuple[Housing, ...]] = tuple(Housing)
+
 
 class OccupationType(Enum):
     """Type of occupation of the requisitioner.
@@ -217,13 +250,41 @@ class OccupationType(Enum):
     FREELANCER = "Trabajo por mi cuenta"
     BUSINESS_OWNER = "Tengo un negocio"
 
+    @staticmethod
+    def parse_from_label(label: str) -> OccupationType:
+        """Parses a raw label from the requisition page to its `OccupationType` member. Returns `OccupationType.UNKNOWN` on failure.
+
+        A plain dict lookup with an explicit fallback, skipping the `EnumMeta.__call__` machinery
+        and covering empty and undefined labels, as the class docstring prescribes.
+        """
+
+        return _OCCUPATION_TYPE_BY_VALUE.get(label, OccupationType.UNKNOWN)
+
+
+# Inverse lookup map for parsing `OccupationType` members from their raw label values, like `_DESTINATION_BY_VALUE`.
+_OCCUPATION_TYPE_BY_VALUE: Final[dict[str, OccupationType]] = {member.value: member for member in OccupationType}
+# Compact integer codes and reverse member lookup for `OccupationType`, like the `Destination` tables.
+_OCCUPATION_TYPE_CODES: Final[dict[OccupationType, int]] = {member: index for index, member in enumerate(OccupationType)}
+_OCCUPATION_TYPE_MEMBERS: Final[tuple[OccupationType, ...]] = tuple(OccupationType)
 
+
+# Bit masks of the boolean fields packed into `DetailedRequisition.flags`; shared by the
+# constructor, the property views and the generated matchers.
+_HAS_MAJOR_MEDICAL_INSURANCE_FLAG: Final = 1
+_HAS_OWN_VEHICLE_FLAG: Final = 2
+_IS_PLATFORM_IN_SHAREHOLDER_LIST_FLAG: Final = 4
+
+
+@dataclass(frozen=True, slots=True)
 class DetailedRequisition(Requisition):
     """A `DetailedRequisition` represents a fully detailed requisition, contains all information about a requisition collected from the individual requisition page.
 
     Contains further information for credit analysis, including some demographics about the applicant (a.k.a. the requisitioner) as well as income and credit history details.
 
     Note: no personally identifiable information (PII) is collected, all requisitions are anonymized.
+
+    A frozen, slotted dataclass like `Requisition`; the generated constructor takes the base and
+    detailed fields flat, and `from_base` builds an instance from an already scraped `Requisition`.
     """
 
     monthly_payment: float  # Calculated monthly payment.
@@ -234,60 +295,77 @@ class DetailedRequisition(Requisition):
     total_expenses: float
     age: int
     dependents: int
-    has_major_medical_insurance: bool
-    has_own_vehicle: bool
-    education: Education
+    # The boolean fields are taken as separate constructor arguments but stored packed into the
+    # single `flags` bitfield: one small int instead of three pointers, and the matchers test
+    # bits with one AND. Property views with the original names are attached after the class.
+    has_major_medical_insurance: InitVar[bool]
+    has_own_vehicle: InitVar[bool]
+    # The categorical fields are taken as enum members by the constructor but stored only as
+    # compact integer codes: one small int per field instead of an enum member plus a derived
+    # code, so the matchers and batch columns read the stored value with no unwrapping.
+    # Enum-typed views under the same names are attached as properties after the class statement.
+    education: InitVar[Education]
     state_of_residence: str  # TODO: not strictly required for evaluation, an `Enum` could be created for this. State of residence in Mexico.
-    housing: Housing
+    housing: InitVar[Housing]
     occupation: str  # Occupation or job position as indicated by the requisitioner, this is a free input, not an enumeration. When undisclosed by the requisitioner, may indicate opacity and higher risk of default.
     tenure: int  # Number of years at the last reported occupation, as indicated by the requisitioner.
-    occupation_type: OccupationType
-    is_platform_in_shareholder_list: bool
-
-    def __init__(
-        self, 
-        base_requisition: Requisition,
-        monthly_payment: float,
-        credit_history_length: int,
-        credit_history_inquiries: int,
-        opened_accounts: int,
-        total_income: float,
-        total_expenses: float,
-        age: int,
-        dependents: int,
+    occupation_type: InitVar[OccupationType]
+    is_platform_in_shareholder_list: InitVar[bool]
+    education_code: int = field(init=False)
+    housing_code: int = field(init=False)
+    occupation_type_code: int = field(init=False)
+    flags: int = field(init=False)
+
+    def __post_init__(
+        self,
         has_major_medical_insurance: bool,
         has_own_vehicle: bool,
         education: Education,
-        state_of_residence: str,
         housing: Housing,
-        occupation: str,
-        tenure: int,
         occupation_type: OccupationType,
         is_platform_in_shareholder_list: bool
     ):
-        super().__init__(**base_requisition.__dict__)  # Passed as `dict` so it can be unpacked.
-        self.monthly_payment = monthly_payment
-        self.credit_history_length = credit_history_length
-        self.credit_history_inquiries = credit_history_inquiries
-        self.opened_accounts = opened_accounts
-        self.total_income = total_income
-        self.total_expenses = total_expenses
-        self.age = age
-        self.dependents = dependents
-        self.has_major_medical_insurance = has_major_medical_insurance
-        self.has_own_vehicle = has_own_vehicle
-        self.education = education
-        self.state_of_residence = state_of_residence
-        self.housing = housing
-        self.occupation = occupation
-        self.tenure = tenure
-        self.occupation_type = occupation_type
-        self.is_platform_in_shareholder_list = is_platform_in_shareholder_list
+        """Derives the compact categorical codes and the packed flags on top of the base derivations.
+
+        `super()` is spelled with explicit arguments because `slots=True` makes the dataclass
+        decorator rebuild the class, which breaks the zero-argument form before Python 3.12.
+        """
+
+        super(DetailedRequisition, self).__post_init__()
+        object.__setattr__(
+            self,
+            "flags",
+            (_HAS_MAJOR_MEDICAL_INSURANCE_FLAG if has_major_medical_insurance else 0)
+            | (_HAS_OWN_VEHICLE_FLAG if has_own_vehicle else 0)
+            | (_IS_PLATFORM_IN_SHAREHOLDER_LIST_FLAG if is_platform_in_shareholder_list else 0)
+        )
+        # `Education` is an `IntEnum` with contiguous values from zero, so the value is the code.
+        object.__setattr__(self, "education_code", int(education))
+        object.__setattr__(self, "housing_code", _HOUSING_CODES[housing])
+        object.__setattr__(self, "occupation_type_code", _OCCUPATION_TYPE_CODES[occupation_type])
+        # Both strings have low cardinality across a scraped corpus (32 Mexican states, a modest
+        # pool of recurring occupation titles), so interning makes every repeated value share one
+        # string object and turns equality checks into pointer comparisons.
+        object.__setattr__(self, "state_of_residence", sys.intern(self.state_of_residence))
+        object.__setattr__(self, "occupation", sys.intern(self.occupation))
+
+    @classmethod
+    def from_base(cls, base_requisition: Requisition, **detailed_fields: Any) -> Self:
+        """Builds a `DetailedRequisition` by extending an already scraped `Requisition` with the detailed fields.
+
+        The base field values are read straight off the given requisition; the derived code
+        fields are recomputed by the constructor, so they are not copied.
+        """
+
+        base_fields = {name: getattr(base_requisition, name) for name in _REQUISITION_INIT_FIELD_NAMES}
+        return cls(**base_fields, **detailed_fields)
 
     def meets_filter(self, filter: Filter | DetailedFilter) -> bool:
         """Applies a `Filter` or `DetailedFilter` to a `DetailedRequisition` and returns whether the requisition meets the filter's criteria.
 
-        Tests filter criteria one by one and stops at the first unmet criterion. Returns `True` if all filter criteria are met; returns `False` otherwise.
+        Runs the specialized matcher function the filter generated at construction,
+        which covers base and detailed criteria in one body and stops at the first unmet criterion.
+        Returns `True` if all filter criteria are met; returns `False` otherwise.
 
         Enumeration items included in both a whitelist and a blacklist are blacklisted; undefined enumeration items are ignored.
 
@@ -297,94 +375,63 @@ class DetailedRequisition(Requisition):
 
         # Evaluate only base `Filter` criteria if the filter is not a `DetailedFilter` to avoid exceptions caused by accessing missing attributes.
         if not isinstance(filter, DetailedFilter):
-            return super().meets_filter(filter)
-        # Evaluate all `DetailedFilter` criteria.
-        if not super().meets_filter(filter):
-            return False
-        if filter.minimum_monthly_payment is not None and filter.minimum_monthly_payment > self.monthly_payment:
-            return False
-        if filter.maximum_monthly_payment is not None and filter.maximum_monthly_payment < self.monthly_payment:
-            return False
-        if filter.minimum_credit_history_length is not None and filter.minimum_credit_history_length > self.credit_history_length:
-            return False
-        if filter.maximum_credit_history_length is not None and filter.maximum_credit_history_length < self.credit_history_length:
-            return False
-        if filter.minimum_credit_history_inquiries is not None and filter.minimum_credit_history_inquiries > self.credit_history_inquiries:
-            return False
-        if filter.maximum_credit_history_inquiries is not None and filter.maximum_credit_history_inquiries < self.credit_history_inquiries:
-            return False
-        if filter.minimum_opened_accounts is not None and filter.minimum_opened_accounts > self.opened_accounts:
-            return False
-        if filter.maximum_opened_accounts is not None and filter.maximum_opened_accounts < self.opened_accounts:
-            return False
-        if filter.minimum_total_income is not None and filter.minimum_total_income > self.total_income:
-            return False
-        if filter.maximum_total_income is not None and filter.maximum_total_income < self.total_income:
-            return False
-        if filter.minimum_total_expenses is not None and filter.minimum_total_expenses > self.total_expenses:
-            return False
-        if filter.maximum_total_expenses is not None and filter.maximum_total_expenses < self.total_expenses:
-            return False
-        if filter.minimum_age is not None and filter.minimum_age > self.age:
-            return False
-        if filter.maximum_age is not None and filter.maximum_age < self.age:
-            return False
-        if filter.minimum_dependents is not None and filter.minimum_dependents > self.dependents:
-            return False
-        if filter.maximum_dependents is not None and filter.maximum_dependents < self.dependents:
-            return False
-        if filter.has_major_medical_insurance is not None and filter.has_major_medical_insurance != self.has_major_medical_insurance:
-            return False
-        if filter.has_own_vehicle is not None and filter.has_own_vehicle != self.has_own_vehicle:
-            return False
-        if filter.minimum_education is not None and filter.minimum_education > self.education:
-            return False
-        if filter.maximum_education is not None and filter.maximum_education < self.education:
-            return False
-        if filter.housing_whitelist is not None:
-            isWhitelisted: bool = False
-            for housing in filter.housing_whitelist:
-                if housing == self.housing:
-                    isWhitelisted = True
-                    break
-            if not isWhitelisted:
-                return False
-        if filter.housing_blacklist is not None:
-            isBlacklisted: bool = False
-            for housing in filter.housing_blacklist:
-                if housing == self.housing:
-                    isBlacklisted = True
-                    break
-            if isBlacklisted:
-                return False
-        if filter.is_occupation_empty is not None and filter.is_occupation_empty != (self.occupation == ""):
-            return False
-        if filter.minimum_tenure is not None and filter.minimum_tenure > self.tenure:
-            return False
-        if filter.maximum_tenure is not None and filter.maximum_tenure < self.tenure:
-            return False
-        if filter.occupation_type_whitelist is not None:
-            isWhitelisted: bool = False
-            for occupation_type in filter.occupation_type_whitelist:
-                if occupation_type == self.occupation_type:
-                    isWhitelisted = True
-                    break
-            if not isWhitelisted:
-                return False
-        if filter.occupation_type_blacklist is not None:
-            isBlacklisted: bool = False
-            for occupation_type in filter.occupation_type_blacklist:
-                if occupation_type == self.occupation_type:
-                    isBlacklisted = True
-                    break
-            if isBlacklisted:
-                return False
-        if filter.is_platform_in_shareholder_list is not None and filter.is_platform_in_shareholder_list != self.is_platform_in_shareholder_list:
-            return False
-        return True
-
-
-class Filter():
+            return super(DetailedRequisition, self).meets_filter(filter)  # Explicit arguments: see `__post_init__`.
+        # Evaluate all `DetailedFilter` criteria, fused into a single generated matcher.
+        return filter._matches_all(self)
+
+
+# Read-only views over the stored categorical codes and packed flags, attached after the class
+# statement (like `_PARAM_NAMES` on the filter classes) because inside the class body these
+# names belong to the InitVar constructor parameters.
+DetailedRequisition.education = property(
+    lambda self: _EDUCATION_MEMBERS[self.education_code],
+    doc="The `Education` member encoded by `education_code`."
+)
+DetailedRequisition.housing = property(
+    lambda self: _HOUSING_MEMBERS[self.housing_code],
+    doc="The `Housing` member encoded by `housing_code`."
+)
+DetailedRequisition.occupation_type = property(
+    lambda self: _OCCUPATION_TYPE_MEMBERS[self.occupation_type_code],
+    doc="The `OccupationType` member encoded by `occupation_type_code`."
+)
+DetailedRequisition.has_major_medical_insurance = property(
+    lambda self: bool(self.flags & _HAS_MAJOR_MEDICAL_INSURANCE_FLAG),
+    doc="Whether the requisitioner reports major medical insurance; bit 0 of `flags`."
+)
+DetailedRequisition.has_own_vehicle = property(
+    lambda self: bool(self.flags & _HAS_OWN_VEHICLE_FLAG),
+    doc="Whether the requisitioner reports a vehicle of their own; bit 1 of `flags`."
+)
+DetailedRequisition.is_platform_in_shareholder_list = property(
+    lambda self: bool(self.flags & _IS_PLATFORM_IN_SHAREHOLDER_LIST_FLAG),
+    doc="Whether the platform appears in the requisition's shareholder list; bit 2 of `flags`."
+)
+
+
+# Compiled code objects for the generated matcher and selector sources, keyed by source text.
+# Criterion values are bound through numbered namespace constants rather than interpolated, so
+# filters with the same combination of active criteria emit byte-identical source; each
+# specialization shape is therefore compiled at most once per process.
+_GENERATED_CODE_CACHE: dict[str, Any] = {}
+
+
+def _compile_generated_source(source: str, filename: str):
+    """Returns the compiled code object for a piece of generated source, cached by source text.
+
+    Compiling dominates the cost of building a specialized matcher or selector; with the cache,
+    every further filter of an already seen shape (including filters rebuilt when unpickled from
+    the filter cache) only pays the exec of the ready code object against its own constants.
+    """
+
+    code = _GENERATED_CODE_CACHE.get(source)
+    if code is None:
+        code = _GENERATED_CODE_CACHE[source] = compile(source, filename, "exec")
+    return code
+
+
+@dataclass(frozen=True, slots=True)
+class Filter:
     """A `Filter` represents a set of filter criteria for a `Requisition`.
 
     Can be used to filter a list of `Requisition` objects based on the filter criteria.
@@ -395,60 +442,328 @@ class Filter():
 
     Adding multiple filters to a YAML file and applying them to a list of requisitions results in the union of their results;
     items matching any of the filters will be included in the filtered list.
+
+    A frozen, slotted dataclass: instances are immutable and hashable (so they can serve as cache keys),
+    and the generated constructor stores each criterion as compiler-emitted straight-line code
+    instead of a hand-written assignment chain.
     """
 
-    minimum_risk_grade: Grade | None
-    maximum_risk_grade: Grade | None
-    minimum_score: int | None
-    maximum_score: int | None
-    minimum_interest_rate: float | None
-    maximum_interest_rate: float | None
-    destination_whitelist: list[Destination] | None
-    destination_blacklist: list[Destination] | None
-    minimum_term: int | None
-    maximum_term: int | None
-    minimum_amount: float | None
-    maximum_amount: float | None
-    minimum_remaining_funding_amount: float | None
-    maximum_remaining_funding_amount: float | None
-    minimum_loan_number: int | None
-    maximum_loan_number: int | None
-
-    def __init__(
-        self,
-        minimum_risk_grade: Grade | None = None,
-        maximum_risk_grade: Grade | None = None,
-        minimum_score: int | None = None,
-        maximum_score: int | None = None,
-        minimum_interest_rate: float | None = None,
-        maximum_interest_rate: float | None = None,
-        destination_whitelist: list[Destination] | None = None,
-        destination_blacklist: list[Destination] | None = None,
-        minimum_term: int | None = None,
-        maximum_term: int | None = None,
-        minimum_amount: float | None = None,
-        maximum_amount: float | None = None,
-        minimum_remaining_funding_amount: float | None = None,
-        maximum_remaining_funding_amount: float | None = None,
-        minimum_loan_number: int | None = None,
-        maximum_loan_number: int | None = None
+    minimum_risk_grade: Grade | None = None
+    maximum_risk_grade: Grade | None = None
+    minimum_score: int | None = None
+    maximum_score: int | None = None
+    minimum_interest_rate: float | None = None
+    maximum_interest_rate: float | None = None
+    destination_whitelist: frozenset[Destination] | None = None
+    destination_blacklist: frozenset[Destination] | None = None
+    minimum_term: int | None = None
+    maximum_term: int | None = None
+    minimum_amount: float | None = None
+    maximum_amount: float | None = None
+    minimum_remaining_funding_amount: float | None = None
+    maximum_remaining_funding_amount: float | None = None
+    minimum_loan_number: int | None = None
+    maximum_loan_number: int | None = None
+    # Specialized matcher generated at construction from the active base criteria.
+    # Derived state: excluded from the constructor, comparisons, hashing and the generated repr.
+    _matches_base: Callable[[Requisition], bool] = field(init=False, repr=False, compare=False)
+    # Specialized columnar selector generated at construction from the same criteria, for batch scans.
+    _selects_base: Callable[[RequisitionBatch], list[int]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Normalizes list criteria and generates the specialized matcher function.
+
+        The class is frozen, so derived state is installed with `object.__setattr__`,
+        the supported escape hatch for frozen dataclasses.
+        """
+
+        # Whitelists and blacklists are stored as frozensets so each membership check
+        # is a single hash lookup instead of a Python-level scan of the list.
+        if self.destination_whitelist is not None:
+            object.__setattr__(self, "destination_whitelist", frozenset(self.destination_whitelist))
+        if self.destination_blacklist is not None:
+            object.__setattr__(self, "destination_blacklist", frozenset(self.destination_blacklist))
+        # Generate a specialized matcher function once, so applying the filter executes exactly
+        # the checks the user set instead of testing every criterion for None per requisition.
+        object.__setattr__(self, "_matches_base", self._build_base_matcher())
+        object.__setattr__(self, "_selects_base", self._build_batch_selector())
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the picklable state of the filter: every criterion, without the generated matcher functions.
+
+        Functions compiled at construction cannot be pickled because they are not importable module attributes,
+        so they are excluded here and regenerated in `__setstate__`.
+        """
+
+        return {filter_field.name: getattr(self, filter_field.name) for filter_field in fields(self) if filter_field.init}
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restores a pickled filter and regenerates its specialized matcher function."""
+
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_matches_base", self._build_base_matcher())
+        object.__setattr__(self, "_selects_base", self._build_batch_selector())
+
+    def apply_to(self, requisitions: Iterable[Requisition]) -> list[Requisition]:
+        """Applies this filter to many requisitions at once and returns the ones that meet its base criteria.
+
+        Binds the generated matcher function to a local name before the loop, so each row costs
+        a single plain function call with no attribute lookups; the thresholds themselves are
+        already embedded in the matcher as constants. This is loop-invariant code motion applied
+        to the interpreter's attribute reads.
+
+        Returns a new list preserving the order of the input requisitions.
+        """
+
+        matches: Callable[[Requisition], bool] = self._matches_base
+        return [requisition for requisition in requisitions if matches(requisition)]
+
+    def apply_to_batch(self, batch: RequisitionBatch) -> list[int]:
+        """Applies this filter's base criteria to a columnar batch and returns the indices of the matching rows.
+
+        Runs the batch selector generated at construction: one loop over the typed columns,
+        bound to local names, with only the active criteria inlined. No per-row objects are
+        materialized; callers can hydrate `Requisition` instances for the surviving indices only.
+        """
+
+        return self._selects_base(batch)
+
+    def _build_batch_selector(self) -> Callable[[RequisitionBatch], list[int]]:
+        """Generates the specialized columnar selector for the base criteria configured on this filter.
+
+        Reuses the row-matcher emitters, then rewrites each criterion to read the batch column at
+        the loop index and skip the row instead of returning, so the per-row attribute access of
+        the object matcher becomes a typed-array subscript. Only the columns the active criteria
+        reference are bound to locals.
+        """
+
+        lines: list[str] = []
+        constants: dict[str, Any] = {}
+        self._emit_base_criteria(lines, constants)
+        return self._compile_batch_selector(lines, constants, RequisitionBatch._SELECTOR_COLUMNS)
+
+    @staticmethod
+    def _compile_batch_selector(
+        lines: list[str],
+        constants: dict[str, Any],
+        selector_columns: dict[str, tuple[tuple[str, ...], str]]
+    ) -> Callable[[RequisitionBatch], list[int]]:
+        """Compiles emitted criterion lines into a columnar selector over the given batch column map.
+
+        Rewrites each `requisition.<attribute>` reference to the column expression the map provides,
+        binds the referenced columns to local names once before the loop, and turns the matcher's
+        early returns into row skips.
+        """
+
+        column_bindings: list[str] = []
+        # Longest names first, so "destination" can never clobber a "destination_code" reference.
+        for attribute_name in sorted(selector_columns, key=len, reverse=True):
+            reference = f"requisition.{attribute_name}"
+            if not any(reference in line for line in lines):
+                continue
+            column_names, expression = selector_columns[attribute_name]
+            for column_name in column_names:
+                binding = f"    {column_name} = batch.{column_name}\n"
+                if binding not in column_bindings:
+                    column_bindings.append(binding)
+            lines = [line.replace(reference, expression) for line in lines]
+        lines = [line.replace(" return False", " continue") for line in lines]
+        source = (
+            "def select(batch):\n"
+            + "".join(column_bindings)
+            + "    selected = []\n"
+            + "    append = selected.append\n"
+            + "    for index in range(len(batch.ids)):\n"
+            + "".join(f"        {line}\n" for line in lines)
+            + "        append(index)\n"
+            + "    return selected\n"
+        )
+        namespace: dict[str, Any] = dict(constants)
+        exec(_compile_generated_source(source, "<generated batch selector>"), namespace)
+        return namespace["select"]
+
+    @staticmethod
+    def _emit_range_criteria(
+        lines: list[str],
+        constants: dict[str, Any],
+        attribute_name: str,
+        minimum: Any,
+        maximum: Any
+    ):
+        """Emits source lines checking a requisition attribute against the given bounds; bounds left as `None` contribute no line."""
+
+        if minimum is not None:
+            constant_name = f"_c{len(constants)}"
+            constants[constant_name] = minimum
+            lines.append(f"if {constant_name} > requisition.{attribute_name}: return False")
+        if maximum is not None:
+            constant_name = f"_c{len(constants)}"
+            constants[constant_name] = maximum
+            lines.append(f"if {constant_name} < requisition.{attribute_name}: return False")
+
+    @staticmethod
+    def _emit_membership_criteria(
+        lines: list[str],
+        constants: dict[str, Any],
+        attribute_name: str,
+        whitelist: frozenset[int] | None,
+        blacklist: frozenset[int] | None
+    ):
+        """Emits source lines checking a requisition code attribute against the given whitelist and blacklist; lists left as `None` contribute no line.
+
+        The lists arrive as frozensets of compact integer codes and are collapsed into single-int
+        bitmasks, with bit `i` set when code `i` is listed: every categorical alphabet here fits
+        in one machine word. The emitted test is then a branchless shift-and-mask on the code,
+        cheaper than hashing into a frozenset for these tiny alphabets.
+        """
+
+        if whitelist is not None:
+            constant_name = f"_c{len(constants)}"
+            constants[constant_name] = sum(1 << code for code in whitelist)
+            lines.append(f"if not {constant_name} >> requisition.{attribute_name} & 1: return False")
+        if blacklist is not None:
+            constant_name = f"_c{len(constants)}"
+            constants[constant_name] = sum(1 << code for code in blacklist)
+            lines.append(f"if {constant_name} >> requisition.{attribute_name} & 1: return False")
+
+    @staticmethod
+    def _to_code_set(members: frozenset | None, codes: dict) -> frozenset[int] | None:
+        """Translates a frozenset of Enum members to the frozenset of their compact integer codes; `None` passes through.
+
+        Generated matchers test membership on codes, so the per-row work hashes a small int
+        instead of an Enum object.
+        """
+
+        if members is None:
+            return None
+        return frozenset(codes[member] for member in members)
+
+    @staticmethod
+    def _emit_equality_criterion(
+        lines: list[str],
+        constants: dict[str, Any],
+        attribute_name: str,
+        expected: Any
     ):
-        self.minimum_risk_grade = minimum_risk_grade
-        self.maximum_risk_grade = maximum_risk_grade
-        self.minimum_score = minimum_score
-        self.maximum_score = maximum_score
-        self.minimum_interest_rate = minimum_interest_rate
-        self.maximum_interest_rate = maximum_interest_rate
-        self.destination_whitelist = destination_whitelist
-        self.destination_blacklist = destination_blacklist
-        self.minimum_term = minimum_term
-        self.maximum_term = maximum_term
-        self.minimum_amount = minimum_amount
-        self.maximum_amount = maximum_amount
-        self.minimum_remaining_funding_amount = minimum_remaining_funding_amount
-        self.maximum_remaining_funding_amount = maximum_remaining_funding_amount
-        self.minimum_loan_number = minimum_loan_number
-        self.maximum_loan_number = maximum_loan_number
+        """Emits a source line checking a requisition attribute for equality with the given value; `None` contributes no line."""
+
+        if expected is None:
+            return
+        constant_name = f"_c{len(constants)}"
+        constants[constant_name] = expected
+        lines.append(f"if requisition.{attribute_name} != {constant_name}: return False")
+
+    @staticmethod
+    def _compile_matcher(lines: list[str], constants: dict[str, Any]) -> Callable[[Requisition], bool]:
+        """Compiles emitted criteria source lines into a single specialized matcher function.
+
+        The generated function body contains only the configured criteria inlined as straight-line
+        comparisons, with criterion values bound through the exec namespace; the interpreter runs it
+        with no per-criterion function calls and no attribute lookups on the filter itself.
+
+        Only trusted, internally generated source reaches this method: the emitted lines interpolate
+        fixed attribute names and generated constant names, never configuration values themselves.
+        """
+
+        body = "".join(f"    {line}\n" for line in lines)
+        source = f"def matches(requisition):\n{body}    return True\n"
+        namespace: dict[str, Any] = dict(constants)
+        exec(_compile_generated_source(source, "<generated filter matcher>"), namespace)
+        return namespace["matches"]
+
+    def _build_base_matcher(self) -> Callable[[Requisition], bool]:
+        """Generates the specialized matcher function for the base criteria configured on this filter."""
+
+        lines: list[str] = []
+        constants: dict[str, Any] = {}
+        self._emit_base_criteria(lines, constants)
+        return self._compile_matcher(lines, constants)
+
+    def _emit_base_criteria(self, lines: list[str], constants: dict[str, Any]):
+        """Emits the source lines for the base criteria configured on this filter.
+
+        Criteria keep the estimated-selectivity order of the former inline chain:
+        narrow scalar windows first, whitelist and blacklist membership checks last.
+        """
+
+        self._emit_range_criteria(lines, constants, "grade", self.minimum_risk_grade, self.maximum_risk_grade)
+        self._emit_range_criteria(lines, constants, "interest_rate", self.minimum_interest_rate, self.maximum_interest_rate)
+        self._emit_range_criteria(lines, constants, "score", self.minimum_score, self.maximum_score)
+        self._emit_range_criteria(lines, constants, "amount", self.minimum_amount, self.maximum_amount)
+        self._emit_range_criteria(lines, constants, "term", self.minimum_term, self.maximum_term)
+        self._emit_range_criteria(lines, constants, "remaining_funding_amount", self.minimum_remaining_funding_amount, self.maximum_remaining_funding_amount)
+        self._emit_range_criteria(lines, constants, "loan_number", self.minimum_loan_number, self.maximum_loan_number)
+        self._emit_membership_criteria(
+            lines,
+            constants,
+            "destination_code",
+            self._to_code_set(self.destination_whitelist, _DESTINATION_CODES),
+            self._to_code_set(self.destination_blacklist, _DESTINATION_CODES)
+        )
+
+    @staticmethod
+    def _load_yaml_document(path: str) -> Any:
+        """Loads and returns the first YAML document in a file as native Python data types."""
+
+        with open(file=path, mode="r", encoding="utf-8") as yaml_file:
+            # Safe loaders are restricted to parsing YAML objects as native Python data types, so here they are parsed as dictionaries.
+            # Unrestricted loaders can instantiate custom classes right away, but open the risk of malicious code injection from untrusted YAML files.
+            return yaml_load(yaml_file, Loader=YamlSafeLoader)
+
+    @staticmethod
+    def _parse_base_arguments(raw_filter: dict[str, Any]) -> dict[str, Any]:
+        """Builds the `Filter` constructor arguments from one raw filter dictionary parsed from YAML.
+
+        Keeps only valid constructor parameters with a key-set intersection (a single C-level operation),
+        instead of copying the raw dictionary and popping unknown keys afterwards;
+        the "**" unpack operator would otherwise forward undefined keys to the constructor and raise an Exception.
+
+        Enum-typed criteria must be converted here because they are expected to be defined as plain `str` values in the config.yml file:
+        `Grade` bounds as Enum member names, and destination lists as web app labels.
+        Whitelists and blacklists are built directly as frozensets of Enum members, the form the constructor stores.
+        """
+
+        arguments: dict[str, Any] = {key: raw_filter[key] for key in raw_filter.keys() & Filter._PARAM_NAMES}
+        if (grade_name := arguments.get("minimum_risk_grade")) is not None:
+            arguments["minimum_risk_grade"] = _GRADE_BY_NAME[grade_name]
+        if (grade_name := arguments.get("maximum_risk_grade")) is not None:
+            arguments["maximum_risk_grade"] = _GRADE_BY_NAME[grade_name]
+        if (whitelist := arguments.get("destination_whitelist")) is not None:
+            arguments["destination_whitelist"] = frozenset(_DESTINATION_BY_VALUE[destination_value] for destination_value in whitelist)
+        if (blacklist := arguments.get("destination_blacklist")) is not None:
+            arguments["destination_blacklist"] = frozenset(_DESTINATION_BY_VALUE[destination_value] for destination_value in blacklist)
+        return arguments
+
+    @staticmethod
+    def _read_filter_cache(path: str, cache_path: str) -> list[Self] | None:
+        """Returns the pickled filter list cached for a YAML file, or `None` when no usable cache exists.
+
+        The cache is considered usable only when it is at least as recent as the YAML file,
+        so editing the configuration invalidates it automatically.
+        Only caches written by this program are ever read here, so unpickling them is safe.
+        """
+
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                with open(file=cache_path, mode="rb") as cache_file:
+                    return pickle.load(cache_file)
+        except (OSError, EOFError, pickle.PickleError, AttributeError):
+            # Missing, stale or unreadable cache: fall back to parsing the YAML file.
+            # EOFError covers the truncated (typically zero-byte) file an interrupted
+            # cache write leaves behind, which pickle reports instead of a PickleError.
+            pass
+        return None
+
+    @staticmethod
+    def _write_filter_cache(cache_path: str, filters: list[Self]):
+        """Pickles a parsed filter list next to its YAML file so later runs can skip parsing it again."""
+
+        try:
+            with open(file=cache_path, mode="wb") as cache_file:
+                pickle.dump(filters, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # A failed cache write only costs a re-parse on the next run.
 
     @staticmethod
     def parse_all_from_yaml(path: str) -> list[Self]:
@@ -463,146 +778,221 @@ class Filter():
         Raises an exception if the YAML file cannot be parsed for any reason.
         """
 
-        data: Any
-        filters: list[Self] = []
-        # Gets __init__ method parameters of the class. This is a dict-like object, and it contains the "self" parameter.
-        # Note that these contain the "self" argument, which is not a valid keyword argument for the constructor.
-        filter_parameters = inspect.signature(Filter.__init__).parameters
-        with open(file=path, mode="r", encoding="utf-8") as yaml_file:
-            # "safe_load" is restricted to parsing YAML objects as native Python data types, so here they are parsed as dictionaries.
-            # "load" can instantiate custom classes right away, but opens the risk of malicious code injection from untrusted YAML files.
-            data = safe_load(yaml_file)
-        for filter in data["filters"]:
-            # Whitelists and blacklists must be processed to convert values to Enum instances to make them compatible with the __init__ constructor. Uses list comprehension.
-            # `IntEnum` filter parameters also must be parsed here because they are expected to be defined as `str` Enum names in the config.yml file.
-            processed_filter: Any = filter.copy()  # Creates a working copy because the filter iterator is read-only.
-            discarded_parameters: list[str] = []
-            if "minimum_risk_grade" in processed_filter:
-                processed_filter["minimum_risk_grade"] = Grade[processed_filter["minimum_risk_grade"]]
-            if "maximum_risk_grade" in processed_filter:
-                processed_filter["maximum_risk_grade"] = Grade[processed_filter["maximum_risk_grade"]]
-            if "destination_whitelist" in processed_filter:
-                processed_filter["destination_whitelist"] = [
-                    Destination(destination_value) for destination_value in processed_filter["destination_whitelist"]
-                ]
-            if "destination_blacklist" in processed_filter:
-                processed_filter["destination_blacklist"] = [
-                    Destination(destination_value) for destination_value in processed_filter["destination_blacklist"]
-                ]
-            # Filters out invalid or undefined keyword arguments from the aggregate data.
-            # This is because the "**" unpack operator passes all key-value pairs as keyword arguments to the __init__ constructor,
-            # including invalid or undefined keyword arguments, and passing them to the constructor raises an Exception.
-            for key, _ in processed_filter.items():
-                if key not in filter_parameters.keys() or key == "self":  # The "self" argument is not a valid keyword argument for the constructor.
-                    # Keys of filter parameters are collected and popped after because popping dictionary items in the loop raises RuntimeError,
-                    # this is similar to the logic behind doing reverse loops to remove items from arrays properly.
-                    discarded_parameters.append(key)
-            for key in discarded_parameters:
-                processed_filter.pop(key)
-            filters.append(Filter(**processed_filter))
+        cache_path: str = f"{path}.{Filter.__name__}.pkl"
+        cached_filters: list[Self] | None = Filter._read_filter_cache(path=path, cache_path=cache_path)
+        if cached_filters is not None:
+            return cached_filters
+        data: Any = Filter._load_yaml_document(path=path)
+        filters: list[Self] = [Filter(**Filter._parse_base_arguments(raw_filter)) for raw_filter in data["filters"]]
+        Filter._write_filter_cache(cache_path=cache_path, filters=filters)
         return filters
 
 
+# Field names accepted by the dataclass-generated constructor, cached once at class creation
+# for key classification during YAML parsing; walks dataclass fields instead of inspect.signature.
+Filter._PARAM_NAMES = frozenset(filter_field.name for filter_field in fields(Filter) if filter_field.init)
+
+
 # TODO: additional calculated filters such as "income-expense ratio", "remaining funding amount ratio to amount ratio" and "monthly payment to free income ratio" could be added to this.
+@dataclass(frozen=True, slots=True)
 class DetailedFilter(Filter):
     """A `DetailedFilter` represents a full set of detailed filter criteria for a `Requisition`.
     
     Can be used to filter a list of `DetailedRequisition` objects based on the filter criteria.
+
+    The generated constructor accepts the inherited base criteria together with the detailed ones,
+    so a detailed filter is built in one call instead of wrapping a separate base `Filter`.
     """
 
-    minimum_monthly_payment: float | None
-    maximum_monthly_payment: float | None
-    minimum_credit_history_length: int | None
-    maximum_credit_history_length: int | None
-    minimum_credit_history_inquiries: int | None
-    maximum_credit_history_inquiries: int | None
-    minimum_opened_accounts: int | None
-    maximum_opened_accounts: int | None
-    minimum_total_income: float | None
-    maximum_total_income: float | None
-    minimum_total_expenses: float | None
-    maximum_total_expenses: float | None
-    minimum_age: int | None
-    maximum_age: int | None
-    minimum_dependents: int | None
-    maximum_dependents: int | None
-    has_major_medical_insurance: bool | None
-    has_own_vehicle: bool | None
-    minimum_education: Education | None
-    maximum_education: Education | None
+    minimum_monthly_payment: float | None = None
+    maximum_monthly_payment: float | None = None
+    minimum_credit_history_length: int | None = None
+    maximum_credit_history_length: int | None = None
+    minimum_credit_history_inquiries: int | None = None
+    maximum_credit_history_inquiries: int | None = None
+    minimum_opened_accounts: int | None = None
+    maximum_opened_accounts: int | None = None
+    minimum_total_income: float | None = None
+    maximum_total_income: float | None = None
+    minimum_total_expenses: float | None = None
+    maximum_total_expenses: float | None = None
+    minimum_age: int | None = None
+    maximum_age: int | None = None
+    minimum_dependents: int | None = None
+    maximum_dependents: int | None = None
+    has_major_medical_insurance: bool | None = None
+    has_own_vehicle: bool | None = None
+    minimum_education: Education | None = None
+    maximum_education: Education | None = None
     # TODO: replace open string argument with enum in requisitions.py, and reference it here.
     # state_of_residence_whitelist: list[str]
     # state_of_residence_blacklist: list[str]
-    housing_whitelist: list[Housing] | None
-    housing_blacklist: list[Housing] | None
-    is_occupation_empty: bool | None  # Checks whether the occupation field is empty, so undisclosed by the requisitioner. May indicate opacity and higher risk of default.
-    minimum_tenure: int | None
-    maximum_tenure: int | None
-    occupation_type_whitelist: list[OccupationType]
-    occupation_type_blacklist: list[OccupationType]
-    is_platform_in_shareholder_list: bool | None
-
-    def __init__(
-        self,
-        base_filter: Filter,
-        minimum_monthly_payment: float | None = None,
-        maximum_monthly_payment: float | None = None,
-        minimum_credit_history_length: int | None = None,
-        maximum_credit_history_length: int | None = None,
-        minimum_credit_history_inquiries: int | None = None,
-        maximum_credit_history_inquiries: int | None = None,
-        minimum_opened_accounts: int | None = None,
-        maximum_opened_accounts: int | None = None,
-        minimum_total_income: float | None = None,
-        maximum_total_income: float | None = None,
-        minimum_total_expenses: float | None = None,
-        maximum_total_expenses: float | None = None,
-        minimum_age: int | None = None,
-        maximum_age: int | None = None,
-        minimum_dependents: int | None = None,
-        maximum_dependents: int | None = None,
-        has_major_medical_insurance: bool | None = None,
-        has_own_vehicle: bool | None = None,
-        minimum_education: Education | None = None,
-        maximum_education: Education | None = None,
-        housing_whitelist: list[Housing] | None = None,
-        housing_blacklist: list[Housing] | None = None,
-        is_occupation_empty: bool | None = None,
-        minimum_tenure: int | None = None,
-        maximum_tenure: int | None = None,
-        occupation_type_whitelist: list[OccupationType] | None = None,
-        occupation_type_blacklist: list[OccupationType] | None = None,
-        is_platform_in_shareholder_list: bool | None = None
-    ):
-        super().__init__(**base_filter.__dict__)  # Passed as `dict` so it can be unpacked.
-        self.minimum_monthly_payment = minimum_monthly_payment
-        self.maximum_monthly_payment = maximum_monthly_payment
-        self.minimum_credit_history_length = minimum_credit_history_length
-        self.maximum_credit_history_length = maximum_credit_history_length
-        self.minimum_credit_history_inquiries = minimum_credit_history_inquiries
-        self.maximum_credit_history_inquiries = maximum_credit_history_inquiries
-        self.minimum_opened_accounts = minimum_opened_accounts
-        self.maximum_opened_accounts = maximum_opened_accounts
-        self.minimum_total_income = minimum_total_income
-        self.maximum_total_income = maximum_total_income
-        self.minimum_total_expenses = minimum_total_expenses
-        self.maximum_total_expenses = maximum_total_expenses
-        self.minimum_age = minimum_age
-        self.maximum_age = maximum_age
-        self.minimum_dependents = minimum_dependents
-        self.maximum_dependents = maximum_dependents
-        self.has_major_medical_insurance = has_major_medical_insurance
-        self.has_own_vehicle = has_own_vehicle
-        self.minimum_education = minimum_education
-        self.maximum_education = maximum_education
-        self.housing_whitelist = housing_whitelist
-        self.housing_blacklist = housing_blacklist
-        self.is_occupation_empty = is_occupation_empty
-        self.minimum_tenure = minimum_tenure
-        self.maximum_tenure = maximum_tenure
-        self.occupation_type_whitelist = occupation_type_whitelist
-        self.occupation_type_blacklist = occupation_type_blacklist
-        self.is_platform_in_shareholder_list = is_platform_in_shareholder_list
+    housing_whitelist: frozenset[Housing] | None = None
+    housing_blacklist: frozenset[Housing] | None = None
+    is_occupation_empty: bool | None = None  # Checks whether the occupation field is empty, so undisclosed by the requisitioner. May indicate opacity and higher risk of default.
+    minimum_tenure: int | None = None
+    maximum_tenure: int | None = None
+    occupation_type_whitelist: frozenset[OccupationType] | None = None
+    occupation_type_blacklist: frozenset[OccupationType] | None = None
+    is_platform_in_shareholder_list: bool | None = None
+    # Specialized matcher generated at construction, covering both base and detailed active criteria.
+    # Derived state: excluded from the constructor, comparisons, hashing and the generated repr.
+    _matches_all: Callable[[DetailedRequisition], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Normalizes list criteria and generates the fused matcher covering base and detailed criteria.
+
+        Calls super with explicit arguments because the slots=True decorator replaces the class object,
+        which breaks the zero-argument form's compiled class reference on Python versions before 3.12.
+        """
+
+        super(DetailedFilter, self).__post_init__()
+        if self.housing_whitelist is not None:
+            object.__setattr__(self, "housing_whitelist", frozenset(self.housing_whitelist))
+        if self.housing_blacklist is not None:
+            object.__setattr__(self, "housing_blacklist", frozenset(self.housing_blacklist))
+        if self.occupation_type_whitelist is not None:
+            object.__setattr__(self, "occupation_type_whitelist", frozenset(self.occupation_type_whitelist))
+        if self.occupation_type_blacklist is not None:
+            object.__setattr__(self, "occupation_type_blacklist", frozenset(self.occupation_type_blacklist))
+        object.__setattr__(self, "_matches_all", self._build_all_matcher())
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the picklable state of the filter, excluding the generated matchers; see `Filter.__getstate__`.
+
+        Must be redefined here because the slots=True decorator injects a default implementation
+        (which would include the unpicklable matcher fields) into any class not defining its own.
+        """
+
+        return super(DetailedFilter, self).__getstate__()
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restores a pickled detailed filter and regenerates both of its specialized matcher functions."""
+
+        super(DetailedFilter, self).__setstate__(state)
+        object.__setattr__(self, "_matches_all", self._build_all_matcher())
+
+    def apply_to(self, requisitions: Iterable[DetailedRequisition]) -> list[DetailedRequisition]:
+        """Applies this filter to many detailed requisitions at once and returns the ones that meet every criterion.
+
+        Same local-binding pattern as the base class method, running the matcher that covers
+        both base and detailed criteria.
+        """
+
+        matches: Callable[[DetailedRequisition], bool] = self._matches_all
+        return [requisition for requisition in requisitions if matches(requisition)]
+
+    def _build_batch_selector(self) -> Callable[[DetailedRequisitionBatch], list[int]]:
+        """Generates the specialized columnar selector covering both base and detailed criteria.
+
+        The returned selector scans a `DetailedRequisitionBatch`, fusing every active comparison
+        into one pass over the typed columns; apply_to_batch on a detailed filter therefore
+        expects a detailed batch.
+        """
+
+        lines: list[str] = []
+        constants: dict[str, Any] = {}
+        self._emit_base_criteria(lines, constants)
+        self._emit_detailed_criteria(lines, constants)
+        return self._compile_batch_selector(lines, constants, DetailedRequisitionBatch._SELECTOR_COLUMNS)
+
+    def _build_all_matcher(self) -> Callable[[DetailedRequisition], bool]:
+        """Generates one specialized matcher function covering both base and detailed criteria.
+
+        Fusing both criteria sets into a single generated body lets DetailedRequisition.meets_filter
+        evaluate a filter with one function call, instead of dispatching through super() and running
+        base and detailed matchers in separate stack frames.
+        """
+
+        lines: list[str] = []
+        constants: dict[str, Any] = {}
+        self._emit_base_criteria(lines, constants)
+        self._emit_detailed_criteria(lines, constants)
+        return self._compile_matcher(lines, constants)
+
+    def _emit_detailed_criteria(self, lines: list[str], constants: dict[str, Any]):
+        """Emits the source lines for the detailed criteria configured on this filter.
+
+        Criteria keep the estimated-selectivity order of the former inline chain:
+        cheap and often decisive boolean flag tests first, then education and the scalar range
+        checks, whitelist and blacklist membership checks last.
+        """
+
+        self._emit_flag_criterion(lines, _IS_PLATFORM_IN_SHAREHOLDER_LIST_FLAG, self.is_platform_in_shareholder_list)
+        self._emit_flag_criterion(lines, _HAS_MAJOR_MEDICAL_INSURANCE_FLAG, self.has_major_medical_insurance)
+        self._emit_flag_criterion(lines, _HAS_OWN_VEHICLE_FLAG, self.has_own_vehicle)
+        if self.is_occupation_empty is not None:
+            constant_name = f"_c{len(constants)}"
+            constants[constant_name] = self.is_occupation_empty
+            lines.append(f"if (requisition.occupation == '') != {constant_name}: return False")
+        self._emit_range_criteria(lines, constants, "education_code", self.minimum_education, self.maximum_education)
+        self._emit_range_criteria(lines, constants, "total_income", self.minimum_total_income, self.maximum_total_income)
+        self._emit_range_criteria(lines, constants, "total_expenses", self.minimum_total_expenses, self.maximum_total_expenses)
+        self._emit_range_criteria(lines, constants, "monthly_payment", self.minimum_monthly_payment, self.maximum_monthly_payment)
+        self._emit_range_criteria(lines, constants, "age", self.minimum_age, self.maximum_age)
+        self._emit_range_criteria(lines, constants, "dependents", self.minimum_dependents, self.maximum_dependents)
+        self._emit_range_criteria(lines, constants, "tenure", self.minimum_tenure, self.maximum_tenure)
+        self._emit_range_criteria(lines, constants, "credit_history_length", self.minimum_credit_history_length, self.maximum_credit_history_length)
+        self._emit_range_criteria(lines, constants, "credit_history_inquiries", self.minimum_credit_history_inquiries, self.maximum_credit_history_inquiries)
+        self._emit_range_criteria(lines, constants, "opened_accounts", self.minimum_opened_accounts, self.maximum_opened_accounts)
+        self._emit_membership_criteria(
+            lines,
+            constants,
+            "housing_code",
+            self._to_code_set(self.housing_whitelist, _HOUSING_CODES),
+            self._to_code_set(self.housing_blacklist, _HOUSING_CODES)
+        )
+        self._emit_membership_criteria(
+            lines,
+            constants,
+            "occupation_type_code",
+            self._to_code_set(self.occupation_type_whitelist, _OCCUPATION_TYPE_CODES),
+            self._to_code_set(self.occupation_type_blacklist, _OCCUPATION_TYPE_CODES)
+        )
+
+    @staticmethod
+    def _emit_flag_criterion(lines: list[str], mask: int, expected: bool | None):
+        """Emits a source line testing one bit of the packed requisition flags; `None` contributes no line.
+
+        The mask is a trusted module constant, so it is interpolated as a literal instead of
+        going through a namespace constant like configured criterion values do.
+        """
+
+        if expected is None:
+            return
+        if expected:
+            lines.append(f"if not requisition.flags & {mask}: return False")
+        else:
+            lines.append(f"if requisition.flags & {mask}: return False")
+
+    @staticmethod
+    def _parse_detailed_arguments(raw_filter: dict[str, Any]) -> dict[str, Any]:
+        """Builds the detailed constructor arguments from one raw filter dictionary parsed from YAML.
+
+        Classifies arguments in a single dict comprehension pass: base filter parameters are not
+        in this constructor's signature, so the cached parameter name set drops them along with
+        invalid or undefined keys; they are parsed separately by the super class helper.
+
+        `Education` bounds are converted from their labels, and whitelists and blacklists
+        are built directly as frozensets of Enum members, the form the constructor stores.
+        """
+
+        arguments: dict[str, Any] = {
+            key: value for key, value in raw_filter.items() if key in DetailedFilter._PARAM_NAMES
+        }
+        if (education_label := arguments.get("minimum_education")) is not None:
+            arguments["minimum_education"] = Education.parse_from_label(education_label)
+        if (education_label := arguments.get("maximum_education")) is not None:
+            arguments["maximum_education"] = Education.parse_from_label(education_label)
+        if (whitelist := arguments.get("housing_whitelist")) is not None:
+            arguments["housing_whitelist"] = frozenset(_HOUSING_BY_VALUE[housing_value] for housing_value in whitelist)
+        if (blacklist := arguments.get("housing_blacklist")) is not None:
+            arguments["housing_blacklist"] = frozenset(_HOUSING_BY_VALUE[housing_value] for housing_value in blacklist)
+        if (whitelist := arguments.get("occupation_type_whitelist")) is not None:
+            arguments["occupation_type_whitelist"] = frozenset(_OCCUPATION_TYPE_BY_VALUE[occupation_type_value] for occupation_type_value in whitelist)
+        if (blacklist := arguments.get("occupation_type_blacklist")) is not None:
+            arguments["occupation_type_blacklist"] = frozenset(_OCCUPATION_TYPE_BY_VALUE[occupation_type_value] for occupation_type_value in blacklist)
+        return arguments
 
     @staticmethod
     def parse_all_from_yaml(path: str) -> list[Self]:
@@ -615,51 +1005,459 @@ class DetailedFilter(Filter):
         Raises an exception if the YAML file cannot be parsed for any reason.
         """
 
-        data: Any
-        base_filters: list[Filter] = Filter.parse_all_from_yaml(path=path)  # List of base filters required by `DetailedFilter` constructor.
-        detailed_filters: list[Self] = []
-        # Gets __init__ method parameters of each class. These are dict-like objects, and they contain the "self" parameter.
-        base_filter_parameters = inspect.signature(Filter.__init__).parameters
-        detailed_filter_parameters = inspect.signature(DetailedFilter.__init__).parameters
-
-        with open(file=path, mode="r", encoding="utf-8") as yaml_file:
-            data = safe_load(yaml_file)  # Gets all filters, with every filter criteria from both base and detailed filter classes.
-        for index, full_filter in enumerate(data["filters"]):
-            # Classifies arguments of each class from the aggregate data. This leaves out invalid or undefined keyword arguments automatically.
-            detailed_filter_arguments: dict[str, Any] = {}
-            base_filter: Filter = base_filters[index]  # Pair each base filter with a detailed filter at the same index. Required argument for the DetailedFilter constructor.
-            detailed_filter: Self
-            for key, value in full_filter.items():
-                # Expects no shadowed attributes. Also, the "self" argument is not a valid keyword argument for __init__, so it is ignored.
-                if key in base_filter_parameters.keys() and key != "self":
-                    # Ignores base filter parameters because they are already collected and parsed using the super class method.
-                    pass
-                if key in detailed_filter_parameters.keys() and key != "self":
-                    detailed_filter_arguments[key] = value
-            if "minimum_education" in detailed_filter_arguments:
-                detailed_filter_arguments["minimum_education"] = Education.parse_from_label(detailed_filter_arguments["minimum_education"])
-            if "maximum_education" in detailed_filter_arguments:
-                detailed_filter_arguments["maximum_education"] = Education.parse_from_label(detailed_filter_arguments["maximum_education"])
-            if "housing_whitelist" in detailed_filter_arguments:
-                detailed_filter_arguments["housing_whitelist"] = [
-                    Housing(housing_value) for housing_value in detailed_filter_arguments["housing_whitelist"]
-                ]
-            if "housing_blacklist" in detailed_filter_arguments:
-                detailed_filter_arguments["housing_blacklist"] = [
-                    Housing(housing_value) for housing_value in detailed_filter_arguments["housing_blacklist"]
-                ]
-            if "occupation_type_whitelist" in detailed_filter_arguments:
-                detailed_filter_arguments["occupation_type_whitelist"] = [
-                    OccupationType(occupation_type_value) for occupation_type_value in detailed_filter_arguments["occupation_type_whitelist"]
-                ]
-            if "occupation_type_blacklist" in detailed_filter_arguments:
-                detailed_filter_arguments["occupation_type_blacklist"] = [
-                    OccupationType(occupation_type_value) for occupation_type_value in detailed_filter_arguments["occupation_type_blacklist"]
-                ]
-            detailed_filter = DetailedFilter(base_filter=base_filter, **detailed_filter_arguments)
-            detailed_filters.append(detailed_filter)
+        cache_path: str = f"{path}.{DetailedFilter.__name__}.pkl"
+        cached_filters: list[Self] | None = DetailedFilter._read_filter_cache(path=path, cache_path=cache_path)
+        if cached_filters is not None:
+            return cached_filters
+        data: Any = Filter._load_yaml_document(path=path)  # Gets all filters, with every filter criteria from both base and detailed filter classes.
+        detailed_filters: list[Self] = [
+            DetailedFilter(**Filter._parse_base_arguments(raw_filter), **DetailedFilter._parse_detailed_arguments(raw_filter))
+            for raw_filter in data["filters"]
+        ]
+        DetailedFilter._write_filter_cache(cache_path=cache_path, filters=detailed_filters)
         return detailed_filters
 
 
+# Detailed-only field names: the inherited base criteria are excluded because they are parsed
+# and converted separately by Filter._parse_base_arguments.
+DetailedFilter._PARAM_NAMES = (
+    frozenset(filter_field.name for filter_field in fields(DetailedFilter) if filter_field.init) - Filter._PARAM_NAMES
+)
+
+
+def meets_any_filter(requisition: Requisition, filters: list[Filter]) -> bool:
+    """Returns whether a requisition meets at least one of the filters, whitelist behavior.
+
+    Stops at the first filter the requisition meets.
+    """
+
+    for filter in filters:
+        if requisition.meets_filter(filter):
+            return True
+    return False
+
+
+def select_matching(requisitions: list[Requisition], filters: list[Filter]) -> list[Requisition]:
+    """Selects the requisitions that meet at least one of the filters, whitelist behavior.
+
+    Batch counterpart of Requisition.meets_filter: applies the whole filter list to the whole
+    requisition list in a single pass, so callers do not re-assemble the matching loop themselves.
+
+    Returns a new list preserving the order of the input requisitions.
+    """
+
+    return [requisition for requisition in requisitions if meets_any_filter(requisition, filters)]
+
+
+def extract_columns(requisitions: list[Requisition], attribute_names: tuple[str, ...]) -> tuple[tuple[Any, ...], ...]:
+    """Transposes a list of requisitions into per-attribute columns, one tuple per requested attribute name.
+
+    `attrgetter` reads every requested attribute in a single C-level call per requisition,
+    and `zip` transposes the resulting row tuples at C level too,
+    so no Python-level loop touches individual fields.
+    This is the structure-of-arrays conversion used to build columnar requisition storage.
+
+    Returns the columns in the same order as `attribute_names`; an empty input yields empty columns.
+    """
+
+    if len(attribute_names) == 1:
+        # attrgetter with a single name returns bare values instead of one-item tuples, so there is nothing to transpose.
+        return (tuple(map(attrgetter(attribute_names[0]), requisitions)),)
+    columns: tuple[tuple[Any, ...], ...] = tuple(zip(*map(attrgetter(*attribute_names), requisitions)))
+    if not columns:
+        return tuple(() for _ in attribute_names)
+    return columns
+
+
+class RequisitionView:
+    """A zero-copy, read-only view of one row of a `RequisitionBatch`.
+
+    Holds only a reference to the batch and a row index; every attribute read pulls one value
+    out of the corresponding column on demand, decoding categorical codes through the module
+    member tables. Sequential passes that read a few fields therefore touch only the columns
+    they use, and never allocate a full `Requisition` per visited row.
+    """
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: RequisitionBatch, index: int):
+        self._batch = batch
+        self._index = index
+
+    @property
+    def id(self) -> str:
+        return self._batch.ids[self._index]
+
+    @property
+    def url(self) -> str:
+        return self._batch.urls[self._index]
+
+    @property
+    def grade(self) -> int:
+        return self._batch.grades[self._index]
+
+    @property
+    def interest_rate(self) -> float:
+        return self._batch.interest_rates[self._index]
+
+    @property
+    def score(self) -> int:
+        return self._batch.scores[self._index]
+
+    @property
+    def destination_code(self) -> int:
+        return self._batch.destination_codes[self._index]
+
+    @property
+    def destination(self) -> Destination:
+        return _DESTINATION_MEMBERS[self._batch.destination_codes[self._index]]
+
+    @property
+    def term(self) -> int:
+        return self._batch.terms[self._index]
+
+    @property
+    def amount(self) -> float:
+        return self._batch.amounts[self._index]
+
+    @property
+    def remaining_funding_amount(self) -> float:
+        return self._batch.remaining_funding_amounts[self._index]
+
+    @property
+    def loan_number(self) -> int:
+        return self._batch.loan_numbers[self._index]
+
+
+@dataclass(slots=True)
+class RequisitionBatch:
+    """Columnar storage for a batch of scraped requisitions (structure of arrays).
+
+    Numeric columns are typed `array.array` buffers holding machine-width values contiguously,
+    instead of one boxed Python object per field per requisition; for a large scraped list this
+    cuts memory per row by roughly an order of magnitude and keeps filtering scans cache-friendly.
+    Categorical fields are stored by their compact integer codes, and string fields stay in plain lists.
+
+    Column order and naming mirror the `Requisition` attributes, pluralized.
+    """
+
+    ids: list[str]
+    urls: list[str]
+    # Integer columns are sized to the actual range of each field rather than a uniform 64 bits:
+    # a filter scan streams whole columns through the cache, so halving or quartering the element
+    # width directly cuts the bytes moved per scanned row. Float columns stay C doubles because
+    # narrower floats would round values and could flip comparisons right at criterion bounds.
+    grades: array  # Type code "B": grades fit in an unsigned byte.
+    interest_rates: array  # Type code "d": C doubles, same precision as Python floats.
+    scores: array  # Type code "H": platform scores are small positive integers, 16 bits is roomy.
+    destination_codes: array  # Type code "B": compact integer codes of the `Destination` members.
+    terms: array  # Type code "H": loan terms in months.
+    amounts: array
+    remaining_funding_amounts: array
+    loan_numbers: array  # Type code "H".
+
+    # View class yielded by iteration; subclasses override it along with their columns.
+    _VIEW_CLASS = RequisitionView
+
+    # Attribute names read from each requisition, in the order the constructor takes their columns.
+    _SOURCE_ATTRIBUTES = (
+        "id",
+        "url",
+        "grade",
+        "interest_rate",
+        "score",
+        "destination_code",
+        "term",
+        "amount",
+        "remaining_funding_amount",
+        "loan_number"
+    )
+
+    # Maps requisition attribute names to the batch columns to bind and the expression reading
+    # the equivalent value at the loop index, for the generated batch selectors.
+    _SELECTOR_COLUMNS = {
+        "grade": (("grades",), "grades[index]"),
+        "interest_rate": (("interest_rates",), "interest_rates[index]"),
+        "score": (("scores",), "scores[index]"),
+        "destination_code": (("destination_codes",), "destination_codes[index]"),
+        "term": (("terms",), "terms[index]"),
+        "amount": (("amounts",), "amounts[index]"),
+        "remaining_funding_amount": (("remaining_funding_amounts",), "remaining_funding_amounts[index]"),
+        "loan_number": (("loan_numbers",), "loan_numbers[index]")
+    }
+
+    @classmethod
+    def from_requisitions(cls, requisitions: list[Requisition]) -> Self:
+        """Builds a columnar batch from a list of `Requisition` objects.
+
+        Transposes the objects with `extract_columns`, so each attribute is read in one
+        C-level call per row, then materializes the typed columns in bulk.
+        """
+
+        return cls(**cls._base_columns(requisitions))
+
+    @staticmethod
+    def _base_columns(requisitions: list[Requisition]) -> dict[str, Any]:
+        """Builds the base column keyword arguments shared by this class and its subclasses."""
+
+        columns = extract_columns(requisitions, RequisitionBatch._SOURCE_ATTRIBUTES)
+        ids, urls, grades, interest_rates, scores, destination_codes, terms, amounts, remaining_funding_amounts, loan_numbers = columns
+        return dict(
+            ids=list(ids),
+            urls=list(urls),
+            grades=array("B", grades),
+            interest_rates=array("d", interest_rates),
+            scores=array("H", scores),
+            destination_codes=array("B", destination_codes),
+            terms=array("H", terms),
+            amounts=array("d", amounts),
+            remaining_funding_amounts=array("d", remaining_funding_amounts),
+            loan_numbers=array("H", loan_numbers)
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of requisitions stored in the batch."""
+
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[RequisitionView]:
+        """Iterates the batch as lightweight per-row views instead of materialized requisition objects.
+
+        Each view is a two-slot object reading straight from the columns, so loops that compute
+        statistics over a few fields stay zero-copy. A fresh view is yielded per row, rather
+        than one reused mutable view, so consumers may safely retain rows they iterate over.
+        """
+
+        view_class = self._VIEW_CLASS
+        for index in range(len(self.ids)):
+            yield view_class(self, index)
+
+
+def dictionary_encode(values: tuple[str, ...]) -> tuple[array, list[str]]:
+    """Dictionary-encodes a low-cardinality string column into small-int codes plus a value table.
+
+    Each distinct string is stored once in the returned table and every row holds only its
+    16-bit code, so N string pointers collapse into N small ints plus one dictionary;
+    equality checks on the column become int comparisons instead of string comparisons.
+
+    Returns the code column (type code "H") and the table, where `table[code]` recovers the value.
+    """
+
+    codes = array("H")
+    table: list[str] = []
+    code_by_value: dict[str, int] = {}
+    for value in values:
+        code = code_by_value.get(value)
+        if code is None:
+            code = len(table)
+            code_by_value[value] = code
+            table.append(value)
+        codes.append(code)
+    return codes, table
+
+
+class DetailedRequisitionView(RequisitionView):
+    """A zero-copy, read-only view of one row of a `DetailedRequisitionBatch`.
+
+    Extends the base view with the detailed columns: packed boolean flags are read by bit,
+    categorical codes decode through the module member tables and the dictionary-encoded
+    string columns decode through their value tables, all on demand.
+    """
+
+    __slots__ = ()
+
+    @property
+    def monthly_payment(self) -> float:
+        return self._batch.monthly_payments[self._index]
+
+    @property
+    def credit_history_length(self) -> int:
+        return self._batch.credit_history_lengths[self._index]
+
+    @property
+    def credit_history_inquiries(self) -> int:
+        return self._batch.credit_history_inquiries[self._index]
+
+    @property
+    def opened_accounts(self) -> int:
+        return self._batch.opened_accounts[self._index]
+
+    @property
+    def total_income(self) -> float:
+        return self._batch.total_incomes[self._index]
+
+    @property
+    def total_expenses(self) -> float:
+        return self._batch.total_expenses[self._index]
+
+    @property
+    def age(self) -> int:
+        return self._batch.ages[self._index]
+
+    @property
+    def dependents(self) -> int:
+        return self._batch.dependents[self._index]
+
+    @property
+    def flags(self) -> int:
+        return self._batch.flags[self._index]
+
+    @property
+    def has_major_medical_insurance(self) -> bool:
+        return bool(self._batch.flags[self._index] & _HAS_MAJOR_MEDICAL_INSURANCE_FLAG)
+
+    @property
+    def has_own_vehicle(self) -> bool:
+        return bool(self._batch.flags[self._index] & _HAS_OWN_VEHICLE_FLAG)
+
+    @property
+    def is_platform_in_shareholder_list(self) -> bool:
+        return bool(self._batch.flags[self._index] & _IS_PLATFORM_IN_SHAREHOLDER_LIST_FLAG)
+
+    @property
+    def education_code(self) -> int:
+        return self._batch.education_codes[self._index]
+
+    @property
+    def education(self) -> Education:
+        return _EDUCATION_MEMBERS[self._batch.education_codes[self._index]]
+
+    @property
+    def state_of_residence(self) -> str:
+        batch = self._batch
+        return batch.state_of_residence_values[batch.state_of_residence_codes[self._index]]
+
+    @property
+    def housing_code(self) -> int:
+        return self._batch.housing_codes[self._index]
+
+    @property
+    def housing(self) -> Housing:
+        return _HOUSING_MEMBERS[self._batch.housing_codes[self._index]]
+
+    @property
+    def occupation(self) -> str:
+        batch = self._batch
+        return batch.occupation_values[batch.occupation_codes[self._index]]
+
+    @property
+    def tenure(self) -> int:
+        return self._batch.tenures[self._index]
+
+    @property
+    def occupation_type_code(self) -> int:
+        return self._batch.occupation_type_codes[self._index]
+
+    @property
+    def occupation_type(self) -> OccupationType:
+        return _OCCUPATION_TYPE_MEMBERS[self._batch.occupation_type_codes[self._index]]
+
+
+@dataclass(slots=True)
+class DetailedRequisitionBatch(RequisitionBatch):
+    """Columnar storage for a batch of `DetailedRequisition` objects, extending the base batch columns.
+
+    Categorical fields (education, housing, occupation type) are stored by their compact integer
+    codes in byte-wide columns, and the packed boolean bitfield rides in one byte per row. The
+    low-cardinality free-form
+    strings (state of residence, occupation) are dictionary-encoded: rows hold 16-bit codes into
+    one value table per column, so repeated values share a single stored string.
+    """
+
+    # Like the base columns, integer widths follow the value ranges: years and person counts fit
+    # in a byte, count-like fields get 16 bits, monetary amounts stay C doubles.
+    monthly_payments: array
+    credit_history_lengths: array  # Type code "B": credit history length in years.
+    credit_history_inquiries: array  # Type code "H".
+    opened_accounts: array  # Type code "H".
+    total_incomes: array
+    total_expenses: array
+    ages: array  # Type code "B".
+    dependents: array  # Type code "B".
+    flags: array  # Type code "B": the packed boolean bitfield, same masks as `DetailedRequisition.flags`.
+    education_codes: array  # Type code "B": `Education` is an IntEnum, its value is the code.
+    state_of_residence_codes: array  # Dictionary-encoded; decode through state_of_residence_values.
+    state_of_residence_values: list[str]
+    housing_codes: array
+    occupation_codes: array  # Dictionary-encoded; decode through occupation_values.
+    occupation_values: list[str]
+    tenures: array  # Type code "B": years at the current occupation.
+    occupation_type_codes: array
+
+    _VIEW_CLASS = DetailedRequisitionView
+
+    # Column map for the generated batch selectors, extending the base map with the detailed
+    # attributes. Boolean criteria test bits of the packed flags byte; the dictionary-encoded
+    # string columns are decoded through their value tables.
+    _SELECTOR_COLUMNS = {
+        **RequisitionBatch._SELECTOR_COLUMNS,
+        "monthly_payment": (("monthly_payments",), "monthly_payments[index]"),
+        "credit_history_length": (("credit_history_lengths",), "credit_history_lengths[index]"),
+        "credit_history_inquiries": (("credit_history_inquiries",), "credit_history_inquiries[index]"),
+        "opened_accounts": (("opened_accounts",), "opened_accounts[index]"),
+        "total_income": (("total_incomes",), "total_incomes[index]"),
+        "total_expenses": (("total_expenses",), "total_expenses[index]"),
+        "age": (("ages",), "ages[index]"),
+        "dependents": (("dependents",), "dependents[index]"),
+        "flags": (("flags",), "flags[index]"),
+        "education_code": (("education_codes",), "education_codes[index]"),
+        "state_of_residence": (("state_of_residence_codes", "state_of_residence_values"), "state_of_residence_values[state_of_residence_codes[index]]"),
+        "housing_code": (("housing_codes",), "housing_codes[index]"),
+        "occupation": (("occupation_codes", "occupation_values"), "occupation_values[occupation_codes[index]]"),
+        "tenure": (("tenures",), "tenures[index]"),
+        "occupation_type_code": (("occupation_type_codes",), "occupation_type_codes[index]")
+    }
+
+    # Attribute names read from each detailed requisition, beyond the base ones.
+    _DETAILED_SOURCE_ATTRIBUTES = (
+        "monthly_payment",
+        "credit_history_length",
+        "credit_history_inquiries",
+        "opened_accounts",
+        "total_income",
+        "total_expenses",
+        "age",
+        "dependents",
+        "flags",
+        "education_code",
+        "state_of_residence",
+        "housing_code",
+        "occupation",
+        "tenure",
+        "occupation_type_code"
+    )
+
+    @classmethod
+    def from_requisitions(cls, requisitions: list[DetailedRequisition]) -> Self:
+        """Builds a columnar batch from a list of `DetailedRequisition` objects."""
+
+        columns = extract_columns(requisitions, cls._DETAILED_SOURCE_ATTRIBUTES)
+        (monthly_payments, credit_history_lengths, credit_history_inquiries, opened_accounts,
+         total_incomes, total_expenses, ages, dependents, flags, education_codes,
+         states_of_residence, housing_codes, occupations, tenures, occupation_type_codes) = columns
+        state_of_residence_codes, state_of_residence_values = dictionary_encode(states_of_residence)
+        occupation_codes, occupation_values = dictionary_encode(occupations)
+        return cls(
+            **cls._base_columns(requisitions),
+            monthly_payments=array("d", monthly_payments),
+            credit_history_lengths=array("B", credit_history_lengths),
+            credit_history_inquiries=array("H", credit_history_inquiries),
+            opened_accounts=array("H", opened_accounts),
+            total_incomes=array("d", total_incomes),
+            total_expenses=array("d", total_expenses),
+            ages=array("B", ages),
+            dependents=array("B", dependents),
+            flags=array("B", flags),
+            education_codes=array("B", education_codes),
+            state_of_residence_codes=state_of_residence_codes,
+            state_of_residence_values=state_of_residence_values,
+            housing_codes=array("B", housing_codes),
+            occupation_codes=occupation_codes,
+            occupation_values=occupation_values,
+            tenures=array("B", tenures),
+            occupation_type_codes=array("B", occupation_type_codes)
+        )
+
+
 if __name__ == "__main__":
     pass